@@ -3,7 +3,7 @@ from __future__ import annotations
 import aiohttp
 from discord import Attachment
 
-SUPPORTED_IMAGE_TYPES = {"image/jpeg", "image/png"}
+SUPPORTED_IMAGE_TYPES = frozenset({"image/jpeg", "image/png"})
 MAX_IMAGE_SIZE = 20 * 1024 * 1024
 MAX_FILE_SIZE = 48 * 1024 * 1024
 
@@ -20,7 +20,7 @@ async def fetch_attachment_bytes(cog, attachment: Attachment) -> bytes | None:
                 attachment.url,
                 response.status,
             )
-    except aiohttp.ClientError as error:
+    except (TimeoutError, aiohttp.ClientError) as error:
         cog.logger.warning("Error fetching attachment %s: %s", attachment.url, error)
     return None
 
@@ -23,12 +23,17 @@ from .command_options import DEFAULT_CHAT_MODEL_ID
 from .embed_delivery import send_embed_batches
 from .embeds import (
     append_pricing_embed,
-    append_reasoning_embeds,
-    append_response_embeds,
     append_sources_embed,
+    build_reasoning_embeds,
+    build_response_embeds,
 )
 from .models import ChatCompletionParameters, Conversation
-from .state import create_button_view
+from .state import (
+    create_button_view,
+    find_conversation,
+    register_conversation,
+    unregister_conversation,
+)
 from .tooling import (
     MODEL_REASONING_EFFORTS,
     MULTI_AGENT_MODELS,
@@ -45,6 +50,12 @@ from .tooling import (
     truncate_text,
 )
 
+# Discord shows a typing indicator for ~10s per trigger, so refresh just inside that.
+TYPING_REFRESH_SECONDS = 9
+
+# Each upload buffers the whole attachment (up to 48 MiB), so cap the fan-out.
+MAX_CONCURRENT_FILE_UPLOADS = 3
+
 
 def _get_mcp_config_module():
     """Resolve MCP config lazily so module reloads in tests don't leave stale refs."""
@@ -65,29 +76,29 @@ async def keep_typing(cog, channel: Any) -> None:
     """Keep the Discord typing indicator alive while Grok is working."""
     try:
         while True:
-            async with channel.typing():
-                await asyncio.sleep(5)
-    except asyncio.CancelledError:
-        raise
+            await channel.trigger_typing()
+            await asyncio.sleep(TYPING_REFRESH_SECONDS)
+    except (DiscordException, aiohttp.ClientError) as error:
+        cog.logger.debug("Typing indicator stopped: %s", error)
 
 
 async def handle_on_message(cog, message: Message) -> None:
     """Route follow-up messages into active Grok conversations."""
-    if message.author == cog.bot.user:
+    if not cog.conversation_index:
+        return
+    bot_user = cog.bot.user
+    if bot_user is not None and message.author.id == bot_user.id:
         return
 
-    for conversation in cog.conversations.values():
-        if message.channel.id != conversation.params.channel_id:
-            continue
-        if message.author != conversation.params.conversation_starter:
-            continue
+    conversation = find_conversation(cog, message.channel.id, message.author.id)
+    if conversation is None:
+        return
 
-        cog.logger.info(
-            "Processing followup message for conversation %s",
-            conversation.params.conversation_id,
-        )
-        await cog.handle_new_message_in_conversation(message, conversation)
-        break
+    cog.logger.info(
+        "Processing followup message for conversation %s",
+        conversation.params.conversation_id,
+    )
+    await cog.handle_new_message_in_conversation(message, conversation)
 
 
 async def handle_check_permissions(ctx: ApplicationContext) -> None:
@@ -146,6 +157,33 @@ async def handle_new_message_in_conversation(cog, message: Message, conversation
                 )
                 return
 
+            # Fetch and upload non-image attachments concurrently (bounded), then
+            # consume the results in message order below. Each id is recorded on
+            # the conversation as soon as its upload lands, so cleanup still
+            # finds it if a sibling upload fails.
+            upload_targets = [
+                attachment
+                for attachment in message.attachments
+                if (attachment.content_type or "").lower() not in SUPPORTED_IMAGE_TYPES
+            ]
+            upload_slots = asyncio.Semaphore(MAX_CONCURRENT_FILE_UPLOADS)
+
+            async def upload(attachment: Attachment) -> str | None:
+                async with upload_slots:
+                    file_id = await cog._upload_file_attachment(attachment)
+                if file_id:
+                    conversation.file_ids.append(file_id)
+                return file_id
+
+            # upload_file_attachment already logs and swallows every Exception,
+            # so return_exceptions is purely defensive: one unexpected raise
+            # must not discard the ids its siblings already recorded.
+            uploaded_file_ids = iter(
+                await asyncio.gather(
+                    *(upload(attachment) for attachment in upload_targets),
+                    return_exceptions=True,
+                )
+            )
             for attachment in message.attachments:
                 content_type = (attachment.content_type or "").lower()
                 if content_type in SUPPORTED_IMAGE_TYPES:
@@ -160,9 +198,14 @@ async def handle_new_message_in_conversation(cog, message: Message, conversation
                         {"type": "input_image", "image_url": attachment.url, "detail": "high"}
                     )
                 else:
-                    file_id = await cog._upload_file_attachment(attachment)
-                    if file_id:
-                        conversation.file_ids.append(file_id)
+                    file_id = next(uploaded_file_ids)
+                    if isinstance(file_id, BaseException):
+                        cog.logger.warning(
+                            "Failed to upload file %s to xAI: %s",
+                            attachment.filename,
+                            file_id,
+                        )
+                    elif file_id:
                         content_parts.append({"type": "input_file", "file_id": file_id})
 
         if not content_parts:
@@ -209,8 +252,7 @@ async def handle_new_message_in_conversation(cog, message: Message, conversation
             conversation.previous_response_id = response_id
             conversation.touch()
 
-        append_reasoning_embeds(embeds, reasoning_text)
-        append_response_embeds(embeds, response_text)
+        embeds = build_reasoning_embeds(reasoning_text) + build_response_embeds(response_text)
         append_sources_embed(embeds, tool_info["citations"])
 
         request_cost = calculate_cost(
@@ -337,24 +379,20 @@ async def run_chat_command(
         )
         return
 
-    for conversation in cog.conversations.values():
-        if (
-            conversation.params.conversation_starter == ctx.author
-            and conversation.params.channel_id == ctx.channel.id
-        ):
-            await send_embed_batches(
-                ctx.send_followup,
-                embed=Embed(
-                    title="Error",
-                    description=(
-                        "You already have an active conversation in this channel. "
-                        "Please finish it before starting a new one."
-                    ),
-                    color=Colour.red(),
+    if find_conversation(cog, ctx.channel.id, ctx.author.id) is not None:
+        await send_embed_batches(
+            ctx.send_followup,
+            embed=Embed(
+                title="Error",
+                description=(
+                    "You already have an active conversation in this channel. "
+                    "Please finish it before starting a new one."
                 ),
-                logger=cog.logger,
-            )
-            return
+                color=Colour.red(),
+            ),
+            logger=cog.logger,
+        )
+        return
 
     main_conversation_id: int | None = None
     try:
@@ -604,47 +642,50 @@ async def run_chat_command(
         tool_usage = response_json.get("server_side_tool_usage", {})
 
         truncated_prompt = truncate_text(prompt, 2000)
-        description = f"**Prompt:** {truncated_prompt}\n"
-        description += f"**Model:** {model}\n"
+        description_lines = [
+            f"**Prompt:** {truncated_prompt}",
+            f"**Model:** {model}",
+        ]
         if system_prompt:
-            description += f"**System:** {truncate_text(system_prompt, 500)}\n"
+            description_lines.append(f"**System:** {truncate_text(system_prompt, 500)}")
         if max_tokens is not None:
-            description += f"**Max Tokens:** {max_tokens}\n"
+            description_lines.append(f"**Max Tokens:** {max_tokens}")
         if temperature is not None:
-            description += f"**Temperature:** {temperature}\n"
+            description_lines.append(f"**Temperature:** {temperature}")
         if top_p is not None:
-            description += f"**Top P:** {top_p}\n"
+            description_lines.append(f"**Top P:** {top_p}")
         if frequency_penalty is not None:
-            description += f"**Frequency Penalty:** {frequency_penalty}\n"
+            description_lines.append(f"**Frequency Penalty:** {frequency_penalty}")
         if presence_penalty is not None:
-            description += f"**Presence Penalty:** {presence_penalty}\n"
+            description_lines.append(f"**Presence Penalty:** {presence_penalty}")
         if reasoning_effort is not None:
-            description += f"**Reasoning Effort:** {reasoning_effort}\n"
+            description_lines.append(f"**Reasoning Effort:** {reasoning_effort}")
         if agent_count is not None:
-            description += f"**Agent Count:** {agent_count}\n"
+            description_lines.append(f"**Agent Count:** {agent_count}")
         if selected_tool_names:
-            description += f"**Tools:** {', '.join(selected_tool_names)}\n"
+            description_lines.append(f"**Tools:** {', '.join(selected_tool_names)}")
         if mcp_preset_names:
-            description += f"**MCP Presets:** {', '.join(mcp_preset_names)}\n"
+            description_lines.append(f"**MCP Presets:** {', '.join(mcp_preset_names)}")
             if mcp_servers:
                 mcp_server = mcp_servers[0]
-                description += (
-                    f"**MCP Server:** {mcp_server.server_label} ({mcp_server.server_url})\n"
+                description_lines.append(
+                    f"**MCP Server:** {mcp_server.server_label} ({mcp_server.server_url})"
                 )
                 if mcp_server.allowed_tool_names:
-                    description += (
-                        "**MCP Allowed Tools:** " + ", ".join(mcp_server.allowed_tool_names) + "\n"
+                    description_lines.append(
+                        f"**MCP Allowed Tools:** {', '.join(mcp_server.allowed_tool_names)}"
                     )
+        description = "\n".join(description_lines) + "\n"
 
         embeds = [
             Embed(
                 title="Conversation Started",
                 description=description,
                 color=Colour.green(),
-            )
+            ),
+            *build_reasoning_embeds(reasoning_text),
+            *build_response_embeds(response_text),
         ]
-        append_reasoning_embeds(embeds, reasoning_text)
-        append_response_embeds(embeds, response_text)
         append_sources_embed(embeds, tool_info["citations"])
 
         request_cost = calculate_cost(
@@ -728,7 +769,7 @@ async def run_chat_command(
             prompt_cache_key=prompt_cache_key,
             grok_conv_id=grok_conv_id,
         )
-        cog.conversations[main_conversation_id] = conversation
+        register_conversation(cog, main_conversation_id, conversation)
 
     except asyncio.CancelledError:
         raise
@@ -758,7 +799,7 @@ async def run_chat_command(
         await cog._strip_previous_view(ctx.author)
         cog.views.pop(ctx.author, None)
         if main_conversation_id is not None:
-            cog.conversations.pop(main_conversation_id, None)
+            unregister_conversation(cog, main_conversation_id)
 
     finally:
         if typing_task:
@@ -766,6 +807,8 @@ async def run_chat_command(
 
 
 __all__ = [
+    "MAX_CONCURRENT_FILE_UPLOADS",
+    "TYPING_REFRESH_SECONDS",
     "handle_check_permissions",
     "handle_new_message_in_conversation",
     "handle_on_message",
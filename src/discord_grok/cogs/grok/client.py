@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import io
 import json
 import random
 from datetime import UTC, datetime
@@ -20,6 +21,10 @@ RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 MAX_API_ATTEMPTS = 5
 INITIAL_RETRY_DELAY_SECONDS = 0.5
 RETRY_JITTER_RATIO = 0.25
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+HTTP_CONNECTION_LIMIT = 32
+HTTP_DNS_CACHE_TTL_SECONDS = 300
+HTTP_KEEPALIVE_TIMEOUT_SECONDS = 75
 
 
 class XaiApiError(Exception):
@@ -37,10 +42,27 @@ async def get_http_session(cog) -> aiohttp.ClientSession:
         return cog._http_session
     async with cog._session_lock:
         if cog._http_session is None or cog._http_session.closed:
-            cog._http_session = aiohttp.ClientSession(timeout=ClientTimeout(total=300, connect=15))
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CONNECTION_LIMIT,
+                ttl_dns_cache=HTTP_DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+            )
+            cog._http_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=ClientTimeout(total=300, connect=15),
+            )
         return cog._http_session
 
 
+async def read_response_into_buffer(response: aiohttp.ClientResponse) -> io.BytesIO:
+    """Stream a download into a rewound in-memory buffer, one chunk at a time."""
+    buffer = io.BytesIO()
+    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+        buffer.write(chunk)
+    buffer.seek(0)
+    return buffer
+
+
 def build_xai_headers(*, grok_conv_id: str | None = None) -> dict[str, str]:
     headers = {
         "Authorization": f"Bearer {XAI_API_KEY}",
@@ -213,20 +235,16 @@ def build_responses_payload(
         payload["tools"] = tools
     if include_encrypted_reasoning:
         payload["include"] = ["reasoning.encrypted_content"]
-    if max_output_tokens is not None:
-        payload["max_output_tokens"] = max_output_tokens
-    if temperature is not None:
-        payload["temperature"] = temperature
-    if top_p is not None:
-        payload["top_p"] = top_p
-    if frequency_penalty is not None:
-        payload["frequency_penalty"] = frequency_penalty
-    if presence_penalty is not None:
-        payload["presence_penalty"] = presence_penalty
-    if reasoning_effort is not None:
-        payload["reasoning_effort"] = reasoning_effort
-    if agent_count is not None:
-        payload["agent_count"] = agent_count
+    sampling_options = (
+        ("max_output_tokens", max_output_tokens),
+        ("temperature", temperature),
+        ("top_p", top_p),
+        ("frequency_penalty", frequency_penalty),
+        ("presence_penalty", presence_penalty),
+        ("reasoning_effort", reasoning_effort),
+        ("agent_count", agent_count),
+    )
+    payload.update((key, value) for key, value in sampling_options if value is not None)
     return payload
 
 
@@ -242,11 +260,11 @@ async def upload_file_attachment(cog, attachment, *, fetch_bytes) -> str | None:
             attachment.size,
         )
         return None
-    file_bytes = await fetch_bytes(attachment)
-    if file_bytes is None:
-        return None
-    client = get_client(cog)
     try:
+        file_bytes = await fetch_bytes(attachment)
+        if file_bytes is None:
+            return None
+        client = get_client(cog)
         uploaded = await client.files.upload(
             file_bytes,
             filename=attachment.filename,
@@ -302,6 +320,10 @@ async def close_http_session(cog) -> None:
 
 
 __all__ = [
+    "DOWNLOAD_CHUNK_SIZE",
+    "HTTP_CONNECTION_LIMIT",
+    "HTTP_DNS_CACHE_TTL_SECONDS",
+    "HTTP_KEEPALIVE_TIMEOUT_SECONDS",
     "INITIAL_RETRY_DELAY_SECONDS",
     "MAX_API_ATTEMPTS",
     "RESPONSES_API_URL",
@@ -324,5 +346,6 @@ __all__ = [
     "get_http_session",
     "parse_retry_after",
     "post_with_retries",
+    "read_response_into_buffer",
     "upload_file_attachment",
 ]
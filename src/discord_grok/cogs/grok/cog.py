@@ -120,6 +120,85 @@ AGENT_COUNT_CHOICES = [
     OptionChoice(name="16 Agents (Deep Research)", value=16),
 ]
 
+IMAGE_MODEL_CHOICES = [
+    OptionChoice(name="Grok Imagine Image Quality", value="grok-imagine-image-quality"),
+    OptionChoice(name="Grok Imagine Image", value="grok-imagine-image"),
+]
+
+IMAGE_ASPECT_RATIO_CHOICES = [
+    OptionChoice(name="1:1 (Square)", value="1:1"),
+    OptionChoice(name="16:9 (Landscape)", value="16:9"),
+    OptionChoice(name="9:16 (Portrait)", value="9:16"),
+    OptionChoice(name="4:3", value="4:3"),
+    OptionChoice(name="3:4", value="3:4"),
+    OptionChoice(name="3:2", value="3:2"),
+    OptionChoice(name="2:3", value="2:3"),
+    OptionChoice(name="2:1", value="2:1"),
+    OptionChoice(name="1:2", value="1:2"),
+    OptionChoice(name="20:9 (Ultrawide)", value="20:9"),
+    OptionChoice(name="9:20", value="9:20"),
+    OptionChoice(name="19.5:9 (Mobile)", value="19.5:9"),
+    OptionChoice(name="9:19.5", value="9:19.5"),
+]
+
+IMAGE_RESOLUTION_CHOICES = [
+    OptionChoice(name="1k", value="1k"),
+    OptionChoice(name="2k", value="2k"),
+]
+
+VIDEO_MODEL_CHOICES = [
+    OptionChoice(name="Grok Imagine Video 1.5 (Preview)", value="grok-imagine-video-1.5-preview"),
+    OptionChoice(name="Grok Imagine Video", value="grok-imagine-video"),
+]
+
+VIDEO_ASPECT_RATIO_CHOICES = [
+    OptionChoice(name="16:9 (Landscape)", value="16:9"),
+    OptionChoice(name="9:16 (Portrait)", value="9:16"),
+    OptionChoice(name="1:1 (Square)", value="1:1"),
+    OptionChoice(name="4:3", value="4:3"),
+    OptionChoice(name="3:4", value="3:4"),
+    OptionChoice(name="3:2", value="3:2"),
+    OptionChoice(name="2:3", value="2:3"),
+]
+
+VIDEO_RESOLUTION_CHOICES = [
+    OptionChoice(name="720p", value="720p"),
+    OptionChoice(name="480p", value="480p"),
+]
+
+TTS_VOICE_CHOICES = [
+    OptionChoice(name="Eve (Energetic, upbeat)", value="eve"),
+    OptionChoice(name="Ara (Warm, friendly)", value="ara"),
+    OptionChoice(name="Rex (Confident, clear)", value="rex"),
+    OptionChoice(name="Sal (Smooth, balanced)", value="sal"),
+    OptionChoice(name="Leo (Authoritative, strong)", value="leo"),
+]
+
+TTS_OUTPUT_FORMAT_CHOICES = [
+    OptionChoice(name="MP3", value="mp3"),
+    OptionChoice(name="WAV (lossless)", value="wav"),
+    OptionChoice(name="PCM (raw)", value="pcm"),
+    OptionChoice(name="μ-law (telephony)", value="mulaw"),
+    OptionChoice(name="A-law (telephony)", value="alaw"),
+]
+
+TTS_SAMPLE_RATE_CHOICES = [
+    OptionChoice(name="8,000 Hz (narrowband)", value=8000),
+    OptionChoice(name="16,000 Hz (wideband)", value=16000),
+    OptionChoice(name="22,050 Hz (standard)", value=22050),
+    OptionChoice(name="24,000 Hz (high quality)", value=24000),
+    OptionChoice(name="44,100 Hz (CD quality)", value=44100),
+    OptionChoice(name="48,000 Hz (studio)", value=48000),
+]
+
+TTS_BIT_RATE_CHOICES = [
+    OptionChoice(name="32 kbps (low)", value=32000),
+    OptionChoice(name="64 kbps (medium)", value=64000),
+    OptionChoice(name="96 kbps (standard)", value=96000),
+    OptionChoice(name="128 kbps (high)", value=128000),
+    OptionChoice(name="192 kbps (maximum)", value=192000),
+]
+
 
 class GrokCog(commands.Cog):
     grok = SlashCommandGroup("grok", "xAI Grok commands", guild_ids=GUILD_IDS)
@@ -140,6 +219,8 @@ class GrokCog(commands.Cog):
         self.logger = logging.getLogger(__name__)
         self.show_cost_embeds = SHOW_COST_EMBEDS
         self.conversations: dict[int, Conversation] = {}
+        # (channel id, starter id) -> conversation id, kept in sync by state.py.
+        self.conversation_index: dict[tuple[int, int], int] = {}
         self.views: dict[Member | User, ButtonView] = {}
         self.last_view_messages: dict[Member | User, Message] = {}
         self.daily_costs: dict[tuple[int, str], float] = {}
@@ -328,12 +409,10 @@ class GrokCog(commands.Cog):
         if session and not session.closed:
             if loop and loop.is_running():
                 loop.create_task(self._close_http_session())
+            elif loop and not loop.is_closed():
+                loop.run_until_complete(self._close_http_session())
             else:
-                new_loop = asyncio.new_event_loop()
-                try:
-                    new_loop.run_until_complete(self._close_http_session())
-                finally:
-                    new_loop.close()
+                asyncio.run(self._close_http_session())
         self._http_session = None
 
     def resolve_selected_tools(
@@ -581,41 +660,21 @@ class GrokCog(commands.Cog):
         description="Choose from the following image generation models. (default: Grok Imagine Image Quality)",
         required=False,
         type=str,
-        choices=[
-            OptionChoice(name="Grok Imagine Image Quality", value="grok-imagine-image-quality"),
-            OptionChoice(name="Grok Imagine Image", value="grok-imagine-image"),
-        ],
+        choices=IMAGE_MODEL_CHOICES,
     )
     @option(
         "aspect_ratio",
         description="Aspect ratio of the image. (default: 1:1)",
         required=False,
         type=str,
-        choices=[
-            OptionChoice(name="1:1 (Square)", value="1:1"),
-            OptionChoice(name="16:9 (Landscape)", value="16:9"),
-            OptionChoice(name="9:16 (Portrait)", value="9:16"),
-            OptionChoice(name="4:3", value="4:3"),
-            OptionChoice(name="3:4", value="3:4"),
-            OptionChoice(name="3:2", value="3:2"),
-            OptionChoice(name="2:3", value="2:3"),
-            OptionChoice(name="2:1", value="2:1"),
-            OptionChoice(name="1:2", value="1:2"),
-            OptionChoice(name="20:9 (Ultrawide)", value="20:9"),
-            OptionChoice(name="9:20", value="9:20"),
-            OptionChoice(name="19.5:9 (Mobile)", value="19.5:9"),
-            OptionChoice(name="9:19.5", value="9:19.5"),
-        ],
+        choices=IMAGE_ASPECT_RATIO_CHOICES,
     )
     @option(
         "resolution",
         description="Image resolution. (default: 1k)",
         required=False,
         type=str,
-        choices=[
-            OptionChoice(name="1k", value="1k"),
-            OptionChoice(name="2k", value="2k"),
-        ],
+        choices=IMAGE_RESOLUTION_CHOICES,
     )
     @option(
         "count",
@@ -662,27 +721,14 @@ class GrokCog(commands.Cog):
         description="Choose from the following video generation models. (default: Grok Imagine Video 1.5)",
         required=False,
         type=str,
-        choices=[
-            OptionChoice(
-                name="Grok Imagine Video 1.5 (Preview)", value="grok-imagine-video-1.5-preview"
-            ),
-            OptionChoice(name="Grok Imagine Video", value="grok-imagine-video"),
-        ],
+        choices=VIDEO_MODEL_CHOICES,
     )
     @option(
         "aspect_ratio",
         description="Aspect ratio of the video. (default: 16:9)",
         required=False,
         type=str,
-        choices=[
-            OptionChoice(name="16:9 (Landscape)", value="16:9"),
-            OptionChoice(name="9:16 (Portrait)", value="9:16"),
-            OptionChoice(name="1:1 (Square)", value="1:1"),
-            OptionChoice(name="4:3", value="4:3"),
-            OptionChoice(name="3:4", value="3:4"),
-            OptionChoice(name="3:2", value="3:2"),
-            OptionChoice(name="2:3", value="2:3"),
-        ],
+        choices=VIDEO_ASPECT_RATIO_CHOICES,
     )
     @option(
         "duration",
@@ -695,10 +741,7 @@ class GrokCog(commands.Cog):
         description="Resolution of the video. (default: 720p)",
         required=False,
         type=str,
-        choices=[
-            OptionChoice(name="720p", value="720p"),
-            OptionChoice(name="480p", value="480p"),
-        ],
+        choices=VIDEO_RESOLUTION_CHOICES,
     )
     @option(
         "attachment",
@@ -742,13 +785,7 @@ class GrokCog(commands.Cog):
         description="Voice to use for synthesis. (default: Eve)",
         required=False,
         type=str,
-        choices=[
-            OptionChoice(name="Eve (Energetic, upbeat)", value="eve"),
-            OptionChoice(name="Ara (Warm, friendly)", value="ara"),
-            OptionChoice(name="Rex (Confident, clear)", value="rex"),
-            OptionChoice(name="Sal (Smooth, balanced)", value="sal"),
-            OptionChoice(name="Leo (Authoritative, strong)", value="leo"),
-        ],
+        choices=TTS_VOICE_CHOICES,
     )
     @option(
         "language",
@@ -761,40 +798,21 @@ class GrokCog(commands.Cog):
         description="Audio codec. (default: mp3)",
         required=False,
         type=str,
-        choices=[
-            OptionChoice(name="MP3", value="mp3"),
-            OptionChoice(name="WAV (lossless)", value="wav"),
-            OptionChoice(name="PCM (raw)", value="pcm"),
-            OptionChoice(name="μ-law (telephony)", value="mulaw"),
-            OptionChoice(name="A-law (telephony)", value="alaw"),
-        ],
+        choices=TTS_OUTPUT_FORMAT_CHOICES,
     )
     @option(
         "sample_rate",
         description="Audio sample rate in Hz. (default: 24000)",
         required=False,
         type=int,
-        choices=[
-            OptionChoice(name="8,000 Hz (narrowband)", value=8000),
-            OptionChoice(name="16,000 Hz (wideband)", value=16000),
-            OptionChoice(name="22,050 Hz (standard)", value=22050),
-            OptionChoice(name="24,000 Hz (high quality)", value=24000),
-            OptionChoice(name="44,100 Hz (CD quality)", value=44100),
-            OptionChoice(name="48,000 Hz (studio)", value=48000),
-        ],
+        choices=TTS_SAMPLE_RATE_CHOICES,
     )
     @option(
         "bit_rate",
         description="MP3 bit rate in bps. Only applies to MP3 codec. (default: 128000)",
         required=False,
         type=int,
-        choices=[
-            OptionChoice(name="32 kbps (low)", value=32000),
-            OptionChoice(name="64 kbps (medium)", value=64000),
-            OptionChoice(name="96 kbps (standard)", value=96000),
-            OptionChoice(name="128 kbps (high)", value=128000),
-            OptionChoice(name="192 kbps (maximum)", value=192000),
-        ],
+        choices=TTS_BIT_RATE_CHOICES,
     )
     async def tts(
         self,
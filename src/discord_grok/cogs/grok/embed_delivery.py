@@ -5,6 +5,7 @@ from typing import Any
 
 from discord import Embed, HTTPException
 
+DISCORD_EMBED_DESCRIPTION_LIMIT = 4096
 DISCORD_EMBED_TOTAL_LIMIT = 6000
 DISCORD_EMBEDS_PER_MESSAGE_LIMIT = 10
 DISCORD_MESSAGE_CONTENT_LIMIT = 2000
@@ -107,22 +108,38 @@ async def send_embed_batches(
             send_kwargs["view"] = view
         _add_files_to_kwargs(send_kwargs, batch_files, single_file_input=single_file_input)
 
-        try:
-            final_message = await send(**send_kwargs)
-        except HTTPException as error:
-            _log_embed_send_failure(logger, error, batch, batches)
-            final_message = await _send_plain_text_fallback(
-                send,
-                batch,
-                batch_files=batch_files,
-                view=view if is_last else None,
-                single_file_input=single_file_input,
-                **kwargs,
-            )
+        # An oversized embed would only come back as a 400; skip the round trip.
+        if exceeds_embed_limits(batch):
+            _log_embed_fallback(logger, "embed exceeds Discord size limits", batch, batches)
+        else:
+            try:
+                final_message = await send(**send_kwargs)
+                continue
+            except HTTPException as error:
+                _log_embed_fallback(logger, error, batch, batches)
+        final_message = await _send_plain_text_fallback(
+            send,
+            batch,
+            batch_files=batch_files,
+            view=view if is_last else None,
+            single_file_input=single_file_input,
+            **kwargs,
+        )
 
     return final_message
 
 
+def exceeds_embed_limits(batch: Iterable[Embed]) -> bool:
+    """Return whether a batch breaks Discord's description or aggregate size limits."""
+
+    total = 0
+    for embed in batch:
+        if len(embed.description or "") > DISCORD_EMBED_DESCRIPTION_LIMIT:
+            return True
+        total += count_embed_chars(embed)
+    return total > DISCORD_EMBED_TOTAL_LIMIT
+
+
 def _normalize_embeds(*, embed: Embed | None, embeds: Iterable[Embed] | None) -> list[Embed]:
     normalized: list[Embed] = []
     if embed is not None:
@@ -251,9 +268,9 @@ def _chunk_plain_text(text: str) -> list[str]:
     return chunks or ["No embed text content available."]
 
 
-def _log_embed_send_failure(
+def _log_embed_fallback(
     logger: Any,
-    error: HTTPException,
+    reason: object,
     batch: list[Embed],
     batches: list[list[Embed]],
 ) -> None:
@@ -261,9 +278,9 @@ def _log_embed_send_failure(
         return
     batch_sizes = [sum(count_embed_chars(embed) for embed in item) for item in batches]
     logger.warning(
-        "Discord rejected embed batch; falling back to plain text: %s "
+        "Embed batch not delivered; falling back to plain text: %s "
         "(failed_batch_embeds=%s failed_batch_chars=%s all_batch_chars=%s)",
-        error,
+        reason,
         len(batch),
         sum(count_embed_chars(embed) for embed in batch),
         batch_sizes,
@@ -283,8 +300,10 @@ def _text_len(value: Any) -> int:
 
 __all__ = [
     "DISCORD_EMBEDS_PER_MESSAGE_LIMIT",
+    "DISCORD_EMBED_DESCRIPTION_LIMIT",
     "DISCORD_EMBED_TOTAL_LIMIT",
     "count_embed_chars",
+    "exceeds_embed_limits",
     "pack_embeds",
     "send_embed_batches",
 ]
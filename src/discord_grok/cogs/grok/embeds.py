@@ -42,34 +42,44 @@ def _source_hostname(url: str) -> str | None:
     return host.removeprefix("www.") if host else None
 
 
-def append_reasoning_embeds(embeds: list[Embed], reasoning_text: str) -> None:
-    """Append reasoning text as a spoilered Discord embed."""
+def build_reasoning_embeds(reasoning_text: str) -> list[Embed]:
+    """Build the spoilered reasoning embed, or nothing when there is no reasoning."""
     if not reasoning_text:
-        return
+        return []
     if len(reasoning_text) > CHUNK_TEXT_SIZE:
         reasoning_text = (
             reasoning_text[: CHUNK_TEXT_SIZE - len(REASONING_TRUNCATION_SUFFIX)]
             + REASONING_TRUNCATION_SUFFIX
         )
-    embeds.append(
+    return [
         Embed(
             title="Reasoning",
             description=f"||{reasoning_text}||",
             color=Colour.light_grey(),
         )
-    )
+    ]
+
+
+def build_response_embeds(response_text: str) -> list[Embed]:
+    """Build response embeds, one per chunk for long responses."""
+    return [
+        Embed(
+            title="Response" + (f" (Part {index})" if index > 1 else ""),
+            description=chunk,
+            color=GROK_BLACK,
+        )
+        for index, chunk in enumerate(chunk_text(response_text), start=1)
+    ]
+
+
+def append_reasoning_embeds(embeds: list[Embed], reasoning_text: str) -> None:
+    """Append reasoning text as a spoilered Discord embed."""
+    embeds.extend(build_reasoning_embeds(reasoning_text))
 
 
 def append_response_embeds(embeds: list[Embed], response_text: str) -> None:
     """Append response text as Discord embeds, handling chunking for long responses."""
-    for index, chunk in enumerate(chunk_text(response_text), start=1):
-        embeds.append(
-            Embed(
-                title="Response" + (f" (Part {index})" if index > 1 else ""),
-                description=chunk,
-                color=GROK_BLACK,
-            )
-        )
+    embeds.extend(build_response_embeds(response_text))
 
 
 def append_sources_embed(embeds: list[Embed], citations: list[CitationInfo]) -> None:
@@ -170,4 +180,6 @@ __all__ = [
     "append_reasoning_embeds",
     "append_response_embeds",
     "append_sources_embed",
+    "build_reasoning_embeds",
+    "build_response_embeds",
 ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import io
 from typing import Any, cast
@@ -7,6 +8,7 @@ from typing import Any, cast
 from discord import ApplicationContext, Attachment, Colour, Embed, File
 from xai_sdk.image import ImageAspectRatio, ImageResolution
 
+from .client import read_response_into_buffer
 from .embed_delivery import send_embed_batches
 from .embeds import GROK_BLACK, append_generation_pricing_embed
 from .tooling import calculate_image_cost, format_xai_error, truncate_text
@@ -86,22 +88,27 @@ async def run_image_command(
                         raise Exception(
                             f"Failed to download image {index + 1}: HTTP {response.status}"
                         )
-                    data = io.BytesIO(await response.read())
+                    data = await read_response_into_buffer(response)
             elif image_result.base64:
-                data = io.BytesIO(base64.b64decode(image_result.base64))
+                # Multi-MB payloads: decode off the event loop.
+                image_bytes = await asyncio.to_thread(base64.b64decode, image_result.base64)
+                data = io.BytesIO(image_bytes)
             else:
                 raise Exception(f"No image data returned for image {index + 1}.")
             filename = f"image_{index + 1}.png" if len(results) > 1 else "image.png"
             files.append(File(data, filename))
 
-        description = f"**Prompt:** {truncate_text(prompt, 2000)}\n"
-        description += f"**Model:** {model}\n"
-        description += f"**Mode:** {mode}\n"
+        description_lines = [
+            f"**Prompt:** {truncate_text(prompt, 2000)}",
+            f"**Model:** {model}",
+            f"**Mode:** {mode}",
+        ]
         if count > 1:
-            description += f"**Count:** {count}\n"
-        description += f"**Aspect Ratio:** {aspect_ratio}\n"
+            description_lines.append(f"**Count:** {count}")
+        description_lines.append(f"**Aspect Ratio:** {aspect_ratio}")
         if resolution is not None:
-            description += f"**Resolution:** {resolution}\n"
+            description_lines.append(f"**Resolution:** {resolution}")
+        description = "\n".join(description_lines) + "\n"
 
         embed = Embed(
             title=mode,
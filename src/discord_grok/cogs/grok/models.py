@@ -14,7 +14,11 @@ class ToolInfo(TypedDict):
     citations: list[CitationInfo]
 
 
-@dataclass
+# The conversation-state dataclasses below are slotted: they live for the
+# whole conversation and are read on every message, so they skip the
+# per-instance __dict__. Setting attributes that are not declared fields
+# (including monkey-patching in tests) raises AttributeError.
+@dataclass(slots=True)
 class McpServerConfig:
     """Validated MCP server configuration persisted with a conversation."""
 
@@ -23,7 +27,7 @@ class McpServerConfig:
     allowed_tool_names: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatCompletionParameters:
     """A dataclass to store the parameters for a chat completion."""
 
@@ -45,7 +49,7 @@ class ChatCompletionParameters:
     paused: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """A dataclass to store conversation state."""
 
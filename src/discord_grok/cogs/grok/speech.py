@@ -67,15 +67,18 @@ async def run_tts_command(
             daily_cost,
         )
 
-        description = f"**Text:** {truncate_text(text, 2000)}\n"
-        description += f"**Voice:** {voice}\n"
-        description += f"**Language:** {language}\n"
-        output_description = output_format
+        format_parts = [output_format]
         if sample_rate is not None:
-            output_description += f" @ {sample_rate:,} Hz"
+            format_parts.append(f"@ {sample_rate:,} Hz")
         if bit_rate is not None and output_format == "mp3":
-            output_description += f" / {bit_rate // 1000} kbps"
-        description += f"**Format:** {output_description}\n"
+            format_parts.append(f"/ {bit_rate // 1000} kbps")
+        description_lines = [
+            f"**Text:** {truncate_text(text, 2000)}",
+            f"**Voice:** {voice}",
+            f"**Language:** {language}",
+            f"**Format:** {' '.join(format_parts)}",
+        ]
+        description = "\n".join(description_lines) + "\n"
 
         embeds = [
             Embed(
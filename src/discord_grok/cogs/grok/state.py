@@ -6,7 +6,7 @@ from datetime import UTC, date, datetime, timedelta
 from discord import Member, User
 
 from .client import cleanup_conversation_files
-from .tooling import SELECTABLE_TOOLS, resolve_selected_tools, resolve_tool_name
+from .tooling import SELECTABLE_TOOL_NAMES, resolve_selected_tools
 from .views import ButtonView
 
 MAX_ACTIVE_CONVERSATIONS = 100
@@ -69,6 +69,41 @@ def log_chat_cost(
     )
 
 
+def _conversation_key(conversation) -> tuple[int, int] | None:
+    starter = conversation.params.conversation_starter
+    channel_id = conversation.params.channel_id
+    if starter is None or channel_id is None:
+        return None
+    return channel_id, starter.id
+
+
+def register_conversation(cog, conversation_id: int, conversation) -> None:
+    """Store a conversation and index it by (channel id, starter id) for routing."""
+    cog.conversations[conversation_id] = conversation
+    key = _conversation_key(conversation)
+    if key is not None:
+        cog.conversation_index[key] = conversation_id
+
+
+def find_conversation(cog, channel_id: int, user_id: int):
+    """Return the active conversation started by ``user_id`` in ``channel_id``."""
+    conversation_id = cog.conversation_index.get((channel_id, user_id))
+    if conversation_id is None:
+        return None
+    return cog.conversations.get(conversation_id)
+
+
+def unregister_conversation(cog, conversation_id: int):
+    """Remove a conversation and its routing index entry, returning it if present."""
+    conversation = cog.conversations.pop(conversation_id, None)
+    if conversation is None:
+        return None
+    key = _conversation_key(conversation)
+    if key is not None and cog.conversation_index.get(key) == conversation_id:
+        del cog.conversation_index[key]
+    return conversation
+
+
 async def strip_previous_view(cog, user: Member | User) -> None:
     """Edit the last message that had buttons to remove its view."""
     prev = cog.last_view_messages.pop(user, None)
@@ -79,7 +114,7 @@ async def strip_previous_view(cog, user: Member | User) -> None:
 
 async def end_conversation(cog, conversation_id: int) -> None:
     """End a conversation and clean up associated resources."""
-    conversation = cog.conversations.pop(conversation_id, None)
+    conversation = unregister_conversation(cog, conversation_id)
     if conversation is None:
         return
     starter = conversation.params.conversation_starter
@@ -111,7 +146,7 @@ async def prune_runtime_state(cog) -> None:
         stale_conversation_ids.extend(cid for cid, _ in active_conversations[:overflow])
 
     for cid in dict.fromkeys(stale_conversation_ids):
-        conversation = cog.conversations.pop(cid, None)
+        conversation = unregister_conversation(cog, cid)
         if conversation is None:
             continue
         starter = conversation.params.conversation_starter
@@ -128,6 +163,10 @@ async def prune_runtime_state(cog) -> None:
         await strip_previous_view(cog, user)
         cog.views.pop(user, None)
 
+    # Follow-up replies record their message even when no view was attached.
+    for user in [user for user in cog.last_view_messages if user not in cog.views]:
+        del cog.last_view_messages[user]
+
     prune_daily_costs(cog)
 
 
@@ -147,10 +186,9 @@ def resolve_tools_for_view(
         return set(), error_message
 
     conversation.params.tools = tools
-    active_names = {
-        tool_name for tool in tools if (tool_name := resolve_tool_name(tool)) in SELECTABLE_TOOLS
-    }
-    return active_names, None
+    # Every selectable name resolves to exactly one tool once resolution
+    # succeeds, so the selection itself is the active set.
+    return set(selected_values) & SELECTABLE_TOOL_NAMES, None
 
 
 def create_button_view(
@@ -184,10 +222,13 @@ __all__ = [
     "MAX_ACTIVE_CONVERSATIONS",
     "create_button_view",
     "end_conversation",
+    "find_conversation",
     "log_chat_cost",
     "prune_daily_costs",
     "prune_runtime_state",
+    "register_conversation",
     "resolve_tools_for_view",
     "strip_previous_view",
     "track_daily_cost",
+    "unregister_conversation",
 ]
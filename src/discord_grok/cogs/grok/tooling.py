@@ -1,5 +1,7 @@
-from collections.abc import Callable
+import re
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
@@ -114,14 +116,14 @@ TTS_VOICES = ["eve", "ara", "rex", "sal", "leo"]
 
 # Models that support frequency_penalty and presence_penalty parameters.
 # Reasoning models do NOT support these parameters.
-PENALTY_SUPPORTED_MODELS: set[str] = {
+PENALTY_SUPPORTED_MODELS: frozenset[str] = frozenset(
     entry.model_id for entry in iter_slash_command_models() if entry.supports_penalties
-}
+)
 
 # Models that support the reasoning_effort parameter.
-REASONING_EFFORT_MODELS: set[str] = {
+REASONING_EFFORT_MODELS: frozenset[str] = frozenset(
     entry.model_id for entry in iter_slash_command_models() if entry.supports_reasoning_effort
-}
+)
 
 # Per-model accepted reasoning_effort values. Different reasoning models accept
 # different subsets (e.g. grok-4.3 accepts none/low/medium/high).
@@ -132,9 +134,9 @@ MODEL_REASONING_EFFORTS: dict[str, frozenset[str]] = {
 }
 
 # Multi-agent models that support agent_count and have special parameter constraints.
-MULTI_AGENT_MODELS: set[str] = {
+MULTI_AGENT_MODELS: frozenset[str] = frozenset(
     entry.model_id for entry in iter_slash_command_models() if entry.supports_multi_agent
-}
+)
 
 # Built-in tools supported by /grok chat.
 TOOL_WEB_SEARCH = "web_search"
@@ -156,6 +158,7 @@ AVAILABLE_TOOLS = {
     TOOL_COLLECTIONS_SEARCH: "Collections Search",
     TOOL_REMOTE_MCP: "Remote MCP",
 }
+AVAILABLE_TOOL_NAMES: frozenset[str] = frozenset(AVAILABLE_TOOLS)
 
 
 # Tool names managed by the conversation tool dropdown.
@@ -228,6 +231,7 @@ TOOL_REGISTRY: dict[str, ToolRegistryEntry] = {
 SELECTABLE_TOOLS = {
     key: entry.display_label for key, entry in TOOL_REGISTRY.items() if entry.ui_selectable
 }
+SELECTABLE_TOOL_NAMES: frozenset[str] = frozenset(SELECTABLE_TOOLS)
 
 # Tool builders that produce Responses API JSON tool dicts.
 TOOL_BUILDERS: dict[str, Callable[..., dict[str, Any]]] = {
@@ -250,8 +254,12 @@ TOOL_USAGE_DISPLAY_NAMES: dict[str, str] = {
 }
 
 
+# Responses API tool type → canonical name, pre-filtered to tools the Discord
+# layer exposes so resolution is a single dict lookup.
 _TOOL_TYPE_TO_CANONICAL: dict[str, str] = {
-    entry.responses_api_type: name for name, entry in TOOL_REGISTRY.items()
+    entry.responses_api_type: name
+    for name, entry in TOOL_REGISTRY.items()
+    if name in AVAILABLE_TOOL_NAMES
 }
 
 
@@ -262,10 +270,7 @@ def resolve_tool_name(tool_config: Any) -> str | None:
     tool_type = tool_config.get("type")
     if not isinstance(tool_type, str):
         return None
-    canonical = _TOOL_TYPE_TO_CANONICAL.get(tool_type)
-    if canonical in AVAILABLE_TOOLS:
-        return canonical
-    return None
+    return _TOOL_TYPE_TO_CANONICAL.get(tool_type)
 
 
 def _normalize_mcp_label(hostname: str) -> str:
@@ -351,7 +356,13 @@ def chunk_text(text: str, chunk_size: int = CHUNK_TEXT_SIZE) -> list[str]:
     Returns:
         A list of strings, where each string is a chunk of the original text.
     """
-    return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+    return _chunk_pattern(chunk_size).findall(text)
+
+
+@lru_cache(maxsize=8)
+def _chunk_pattern(chunk_size: int) -> re.Pattern[str]:
+    # Splitting in the regex engine avoids a Python-level slice per chunk.
+    return re.compile(rf".{{1,{chunk_size}}}", re.DOTALL)
 
 
 def truncate_text(text: str | None, max_length: int, suffix: str = "...") -> str | None:
@@ -370,7 +381,17 @@ def truncate_text(text: str | None, max_length: int, suffix: str = "...") -> str
         return None
     if len(text) <= max_length:
         return text
-    return text[:max_length] + suffix
+    if not suffix:
+        return text[:max_length]
+    return f"{text[:max_length]}{suffix}"
+
+
+@cache
+def _has_grpc_accessors(error_cls: type) -> bool:
+    # Method presence is a property of the class, so probe it once per type.
+    return callable(getattr(error_cls, "details", None)) and callable(
+        getattr(error_cls, "code", None)
+    )
 
 
 def format_xai_error(error: Exception) -> str:
@@ -385,19 +406,18 @@ def format_xai_error(error: Exception) -> str:
     """
     message: str | None = None
     status: Any = None
+    error_cls = type(error)
 
-    details_accessor = getattr(error, "details", None)
-    code_accessor = getattr(error, "code", None)
-    if callable(details_accessor) and callable(code_accessor):
+    if _has_grpc_accessors(error_cls):
         # gRPC AioRpcError: code()/details() are methods, not attributes.
         try:
-            detail = details_accessor()
+            detail = error.details()  # type: ignore[attr-defined]
             if isinstance(detail, str) and detail.strip():
                 message = detail.strip()
         except Exception:  # never fail while formatting an error
             pass
         try:
-            code_value = code_accessor()
+            code_value = error.code()  # type: ignore[attr-defined]
             if code_value is not None:
                 status = getattr(code_value, "name", code_value)
         except Exception:  # never fail while formatting an error
@@ -417,12 +437,10 @@ def format_xai_error(error: Exception) -> str:
             if code_attr is not None and not callable(code_attr):
                 status = code_attr
 
-    error_type = type(error).__name__
-    details = []
-    if status is not None:
-        details.append(f"Status: {status}")
-    if error_type and error_type != "Exception":
-        details.append(f"Error: {error_type}")
+    error_type = error_cls.__name__
+    status_part = f"Status: {status}" if status is not None else None
+    type_part = f"Error: {error_type}" if error_type != "Exception" else None
+    details = tuple(part for part in (status_part, type_part) if part)
 
     if details:
         return f"{message}\n\n" + "\n".join(details)
@@ -431,7 +449,7 @@ def format_xai_error(error: Exception) -> str:
 
 def resolve_selected_tools(
     selected_tool_names: list[str],
-    collection_ids: list[str] | None = None,
+    collection_ids: Sequence[str] | None = None,
     x_search_kwargs: dict[str, Any] | None = None,
     web_search_kwargs: dict[str, Any] | None = None,
     mcp_servers: list[McpServerConfig] | None = None,
@@ -482,6 +500,7 @@ def resolve_selected_tools(
 
 __all__ = [
     "AVAILABLE_TOOLS",
+    "AVAILABLE_TOOL_NAMES",
     "CHUNK_TEXT_SIZE",
     "GROK_IMAGE_MODELS",
     "GROK_MODELS",
@@ -497,6 +516,7 @@ __all__ = [
     "PENALTY_SUPPORTED_MODELS",
     "REASONING_EFFORT_MODELS",
     "SELECTABLE_TOOLS",
+    "SELECTABLE_TOOL_NAMES",
     "TOOL_CODE_EXECUTION",
     "TOOL_COLLECTIONS_SEARCH",
     "TOOL_REGISTRY",
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import io
 from typing import cast
 
 from discord import ApplicationContext, Attachment, Colour, Embed, File
 from xai_sdk.video import VideoAspectRatio, VideoResolution
 
+from .client import read_response_into_buffer
 from .embed_delivery import send_embed_batches
 from .embeds import GROK_BLACK, append_generation_pricing_embed
 from .tooling import GROK_VIDEO_MODELS, calculate_video_cost, format_xai_error, truncate_text
@@ -49,7 +49,7 @@ async def run_video_command(
         async with session.get(result.url) as response:
             if response.status != 200:
                 raise Exception(f"Failed to download video: HTTP {response.status}")
-            video_bytes = await response.read()
+            data = await read_response_into_buffer(response)
 
         # Prefer SDK-reported cost (xai-sdk 1.12+); fall back to YAML pricing
         # when the API does not report cost on this response.
@@ -68,13 +68,15 @@ async def run_video_command(
             daily_cost,
         )
 
-        data = io.BytesIO(video_bytes)
-        description = f"**Prompt:** {truncate_text(prompt, 2000)}\n"
-        description += f"**Model:** {model}\n"
-        description += f"**Mode:** {mode}\n"
-        description += f"**Aspect Ratio:** {aspect_ratio}\n"
-        description += f"**Duration:** {duration}s\n"
-        description += f"**Resolution:** {resolution}\n"
+        description_lines = [
+            f"**Prompt:** {truncate_text(prompt, 2000)}",
+            f"**Model:** {model}",
+            f"**Mode:** {mode}",
+            f"**Aspect Ratio:** {aspect_ratio}",
+            f"**Duration:** {duration}s",
+            f"**Resolution:** {resolution}",
+        ]
+        description = "\n".join(description_lines) + "\n"
 
         embeds = [
             Embed(
@@ -13,12 +13,35 @@ from discord import (
     Interaction,
     Member,
     SelectOption,
-    TextChannel,
     User,
 )
+from discord.abc import Messageable
 from discord.ui import Button, Select, View, button
 
-from .tooling import SELECTABLE_TOOLS, TOOL_REGISTRY, format_xai_error, resolve_tool_name
+from .tooling import (
+    SELECTABLE_TOOL_NAMES,
+    SELECTABLE_TOOLS,
+    TOOL_REGISTRY,
+    format_xai_error,
+    resolve_tool_name,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# (label, value, description) for each dropdown-selectable tool, in registry order.
+_TOOL_OPTION_SPECS: tuple[tuple[str, str, str], ...] = tuple(
+    (entry.display_label, tool_name, entry.description)
+    for tool_name, entry in TOOL_REGISTRY.items()
+    if entry.ui_selectable
+)
+
+# Select kwargs shared by every ButtonView; only the options vary per view.
+_SELECT_BASE_KWARGS: dict[str, Any] = {
+    "placeholder": "Toggle conversation tools",
+    "min_values": 0,
+    "max_values": len(SELECTABLE_TOOLS),
+    "row": 1,
+}
 
 
 def _format_user_error(error: Exception, *, context: str) -> str:
@@ -30,7 +53,7 @@ def _format_user_error(error: Exception, *, context: str) -> str:
 
 async def _send_interaction_error(interaction: Interaction, context: str, error: Exception) -> None:
     """Log an error and send the user a safe ephemeral message."""
-    logging.error("Error in %s: %s", context, error, exc_info=True)
+    LOGGER.error("Error in %s: %s", context, error, exc_info=True)
     msg = _format_user_error(error, context=context)
     if interaction.response.is_done():
         await interaction.followup.send(msg, ephemeral=True)
@@ -78,6 +101,7 @@ class ButtonView(View):
         """
         _initialize_view(self, timeout=None)
         self.conversation_starter = conversation_starter
+        self._starter_id = conversation_starter.id
         self.conversation_id = conversation_id
         self._get_conversation = get_conversation
         self._on_regenerate = on_regenerate
@@ -91,6 +115,9 @@ class ButtonView(View):
             return await asyncio.wrap_future(self._stopped)
         return await super().wait()
 
+    def _is_starter(self, user: Member | User | None) -> bool:
+        return user is not None and user.id == self._starter_id
+
     def _add_tool_select(self, initial_tools: list[Any]) -> None:
         selected_tools = {
             tool_name
@@ -99,19 +126,15 @@ class ButtonView(View):
         }
 
         tool_select = Select(
-            placeholder="Toggle conversation tools",
-            min_values=0,
-            max_values=len(SELECTABLE_TOOLS),
-            row=1,
+            **_SELECT_BASE_KWARGS,
             options=[
                 SelectOption(
-                    label=entry.display_label,
-                    value=tool_name,
-                    description=entry.description,
-                    default=tool_name in selected_tools,
+                    label=label,
+                    value=value,
+                    description=description,
+                    default=value in selected_tools,
                 )
-                for tool_name, entry in TOOL_REGISTRY.items()
-                if entry.ui_selectable
+                for label, value, description in _TOOL_OPTION_SPECS
             ],
         )
 
@@ -119,12 +142,13 @@ class ButtonView(View):
             await self.tool_select_callback(interaction, tool_select)
 
         tool_select.callback = _tool_callback
+        self._tool_select = tool_select
         self.add_item(tool_select)
 
     async def tool_select_callback(self, interaction: Interaction, tool_select: Select) -> None:
         """Toggle tool availability for this conversation."""
         try:
-            if interaction.user != self.conversation_starter:
+            if not self._is_starter(interaction.user):
                 await interaction.response.send_message(
                     "You are not allowed to change tools for this conversation.",
                     ephemeral=True,
@@ -139,7 +163,7 @@ class ButtonView(View):
                 return
 
             selected_values = [
-                value for value in (tool_select.values or []) if value in SELECTABLE_TOOLS
+                value for value in tool_select.values or () if value in SELECTABLE_TOOL_NAMES
             ]
 
             active_names, error_message = self._on_tools_changed(selected_values, conversation)
@@ -148,14 +172,14 @@ class ButtonView(View):
                 return
 
             # Update Select dropdown defaults
-            for child in self.children:
-                if isinstance(child, Select):
-                    for option in child.options:
-                        option.default = option.value in active_names
-                    break
+            for option in self._tool_select.options:
+                option.default = option.value in active_names
 
             if active_names:
-                tool_names = ", ".join(sorted(active_names))
+                # Report in dropdown order; no sort needed.
+                tool_names = ", ".join(
+                    value for _, value, _ in _TOOL_OPTION_SPECS if value in active_names
+                )
                 message = f"Tools updated: {tool_names}."
             else:
                 message = "Tools disabled for this conversation."
@@ -174,12 +198,12 @@ class ButtonView(View):
         Args:
             interaction (Interaction): The interaction object.
         """
-        logging.info("Regenerate button clicked.")
+        LOGGER.info("Regenerate button clicked.")
         saved_response_id: str | None = None
         saved_previous_id: str | None = None
 
         try:
-            if interaction.user != self.conversation_starter:
+            if not self._is_starter(interaction.user):
                 await interaction.response.send_message(
                     "You are not allowed to regenerate the response.", ephemeral=True
                 )
@@ -200,46 +224,42 @@ class ButtonView(View):
                 )
                 return
 
-            # Save state for rollback
-            saved_response_id = conversation.response_id_history[-1]
-            saved_previous_id = conversation.previous_response_id
-
-            # Rewind: pop the last response
-            conversation.response_id_history.pop()
-            conversation.previous_response_id = (
-                conversation.response_id_history[-1] if conversation.response_id_history else None
-            )
-
             channel = interaction.channel
-            if not hasattr(channel, "history"):
-                conversation.response_id_history.append(saved_response_id)
-                conversation.previous_response_id = saved_previous_id
+            if not isinstance(channel, Messageable):
                 await interaction.followup.send(
                     "Couldn't find the message to regenerate.", ephemeral=True
                 )
                 return
 
-            text_channel = cast(TextChannel, channel)
-            recent = [message async for message in text_channel.history(limit=10)]
-            user_message = next(
-                (message for message in recent if message.author == self.conversation_starter),
-                None,
-            )
+            user_message = None
+            async for message in channel.history(limit=10):
+                if message.author.id == self._starter_id:
+                    user_message = message
+                    break
 
             if user_message is None:
-                conversation.response_id_history.append(saved_response_id)
-                conversation.previous_response_id = saved_previous_id
                 await interaction.followup.send(
                     "Couldn't find the message to regenerate.", ephemeral=True
                 )
                 return
 
+            # Save state for rollback. Taken after the lookup so the early
+            # returns above leave the history untouched.
+            saved_response_id = conversation.response_id_history[-1]
+            saved_previous_id = conversation.previous_response_id
+
+            # Rewind: pop the last response
+            conversation.response_id_history.pop()
+            conversation.previous_response_id = (
+                conversation.response_id_history[-1] if conversation.response_id_history else None
+            )
+
             await self._on_regenerate(user_message, conversation)
             await interaction.followup.send("Response regenerated.", ephemeral=True, delete_after=3)
         except asyncio.CancelledError:
             raise
         except (aiohttp.ClientError, DiscordException, ValueError) as error:
-            logging.error("Error in regenerate_button: %s", error, exc_info=True)
+            LOGGER.error("Error in regenerate_button: %s", error, exc_info=True)
 
             if saved_response_id is not None:
                 conversation = self._get_conversation(self.conversation_id)
@@ -267,25 +287,27 @@ class ButtonView(View):
             interaction (Interaction): The interaction object.
         """
         try:
-            if interaction.user != self.conversation_starter:
+            if not self._is_starter(interaction.user):
                 await interaction.response.send_message(
                     "You are not allowed to pause the conversation.", ephemeral=True
                 )
                 return
 
             conversation = self._get_conversation(self.conversation_id)
-            if conversation is not None:
-                conversation.params.paused = not conversation.params.paused
-                status = "paused" if conversation.params.paused else "resumed"
-                await interaction.response.send_message(
-                    f"Conversation {status}. Press again to toggle.",
-                    ephemeral=True,
-                    delete_after=3,
-                )
-            else:
+            if conversation is None:
                 await interaction.response.send_message(
                     "No active conversation found.", ephemeral=True
                 )
+                return
+
+            params = conversation.params
+            params.paused = not params.paused
+            status = "paused" if params.paused else "resumed"
+            await interaction.response.send_message(
+                f"Conversation {status}. Press again to toggle.",
+                ephemeral=True,
+                delete_after=3,
+            )
         except asyncio.CancelledError:
             raise
         except (aiohttp.ClientError, DiscordException, ValueError) as e:
@@ -300,23 +322,23 @@ class ButtonView(View):
             interaction (Interaction): The interaction object.
         """
         try:
-            if interaction.user != self.conversation_starter:
+            if not self._is_starter(interaction.user):
                 await interaction.response.send_message(
                     "You are not allowed to end this conversation.", ephemeral=True
                 )
                 return
 
-            conversation = self._get_conversation(self.conversation_id)
-            if conversation is not None:
-                await self._on_stop(self.conversation_id)
-                button.disabled = True
-                await interaction.response.send_message(
-                    "Conversation ended.", ephemeral=True, delete_after=3
-                )
-            else:
+            if self._get_conversation(self.conversation_id) is None:
                 await interaction.response.send_message(
                     "No active conversation found.", ephemeral=True
                 )
+                return
+
+            await self._on_stop(self.conversation_id)
+            button.disabled = True
+            await interaction.response.send_message(
+                "Conversation ended.", ephemeral=True, delete_after=3
+            )
         except asyncio.CancelledError:
             raise
         except (aiohttp.ClientError, DiscordException, ValueError) as e:
@@ -16,23 +16,22 @@ def _get_env_or_none(name: str) -> str | None:
     return stripped_value or None
 
 
-def _parse_csv_values(raw_values: str) -> list[str]:
-    return [token.strip() for token in raw_values.split(",") if token.strip()]
+def _parse_csv_values(raw_values: str) -> tuple[str, ...]:
+    return tuple(filter(None, map(str.strip, raw_values.split(","))))
 
 
 def _parse_guild_ids(raw_guild_ids: str) -> list[int]:
+    # py-cord types ``guild_ids`` as ``list[int]`` and compares it against
+    # lists, so keep this one a list rather than a tuple.
     guild_ids: list[int] = []
 
-    for token in raw_guild_ids.split(","):
-        stripped_token = token.strip()
-        if not stripped_token:
-            continue
+    for token in _parse_csv_values(raw_guild_ids):
         try:
-            guild_ids.append(int(stripped_token))
+            guild_ids.append(int(token))
         except ValueError as exc:
             raise RuntimeError(
                 "Invalid GUILD_IDS value. Expected a comma-separated list of integers, "
-                f"but received invalid token: {stripped_token!r}."
+                f"but received invalid token: {token!r}."
             ) from exc
 
     return guild_ids
@@ -1,8 +1,13 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 
+async def _async_noop(*args, **kwargs):
+    """Awaitable stand-in for context methods no test inspects."""
+
+
 @pytest.fixture
 def mock_bot():
     """Create a mock Discord bot instance."""
@@ -16,59 +21,52 @@ def mock_bot():
 @pytest.fixture
 def mock_xai_client():
     """Create a mock xAI SDK AsyncClient (files, image, video only)."""
-    with patch("xai_sdk.AsyncClient") as mock_class:
-        client = MagicMock()
-
-        # Mock image.sample
-        mock_image_response = MagicMock()
-        mock_image_response.url = "https://example.com/generated-image.png"
-        mock_image_response.base64 = None
+    # The client and SDK responses are plain attribute containers, so
+    # SimpleNamespace stands in for them; only the awaited client methods need
+    # to be mocks.
+    mock_image_response = SimpleNamespace(
+        url="https://example.com/generated-image.png",
+        base64=None,
         # Default to None so the YAML-fallback cost path is exercised; tests
         # opting into SDK-reported cost should override cost_usd explicitly.
-        mock_image_response.cost_usd = None
-        client.image = MagicMock()
-        client.image.sample = AsyncMock(return_value=mock_image_response)
-        client.image.sample_batch = AsyncMock(
-            return_value=[mock_image_response, mock_image_response]
-        )
-
-        # Mock video.generate
-        mock_video_response = MagicMock()
-        mock_video_response.url = "https://example.com/generated-video.mp4"
-        mock_video_response.cost_usd = None
-        client.video = MagicMock()
-        client.video.generate = AsyncMock(return_value=mock_video_response)
-
-        # Mock files API
-        mock_uploaded_file = MagicMock()
-        mock_uploaded_file.id = "file-abc123"
-        mock_uploaded_file.filename = "document.pdf"
-        mock_uploaded_file.size = 1024
-        client.files = MagicMock()
-        client.files.upload = AsyncMock(return_value=mock_uploaded_file)
-        mock_delete_response = MagicMock()
-        mock_delete_response.deleted = True
-        mock_delete_response.id = "file-abc123"
-        client.files.delete = AsyncMock(return_value=mock_delete_response)
-
-        mock_class.return_value = client
-        yield client
+        cost_usd=None,
+    )
+    mock_video_response = SimpleNamespace(
+        url="https://example.com/generated-video.mp4",
+        cost_usd=None,
+    )
+    mock_uploaded_file = SimpleNamespace(
+        id="file-abc123",
+        filename="document.pdf",
+        size=1024,
+    )
+    return SimpleNamespace(
+        image=SimpleNamespace(
+            sample=AsyncMock(return_value=mock_image_response),
+            sample_batch=AsyncMock(return_value=[mock_image_response, mock_image_response]),
+        ),
+        video=SimpleNamespace(generate=AsyncMock(return_value=mock_video_response)),
+        files=SimpleNamespace(
+            upload=AsyncMock(return_value=mock_uploaded_file),
+            delete=AsyncMock(return_value=SimpleNamespace(deleted=True, id="file-abc123")),
+        ),
+    )
 
 
 @pytest.fixture
 def mock_discord_context():
     """Create a mock Discord application context."""
     ctx = AsyncMock()
+    # Authors stay MagicMocks: the cog keys views by author and SimpleNamespace
+    # is unhashable.
     ctx.author = MagicMock()
     ctx.author.id = 111222333
     ctx.author.name = "TestUser"
-    ctx.channel = MagicMock()
-    ctx.channel.id = 444555666
-    ctx.interaction = MagicMock()
-    ctx.interaction.id = 777888999
-    ctx.defer = AsyncMock()
+    ctx.channel = SimpleNamespace(id=444555666, trigger_typing=AsyncMock())
+    ctx.interaction = SimpleNamespace(id=777888999)
+    ctx.defer = _async_noop
     ctx.send_followup = AsyncMock()
-    ctx.respond = AsyncMock()
+    ctx.respond = _async_noop
     return ctx
 
 
@@ -79,31 +77,34 @@ def mock_discord_message():
     message.author = MagicMock()
     message.author.id = 111222333
     message.author.name = "TestUser"
-    message.channel = MagicMock()
-    message.channel.id = 444555666
+    message.channel = SimpleNamespace(id=444555666, trigger_typing=AsyncMock())
     message.content = "Hello Grok!"
     message.attachments = []
     message.reply = AsyncMock()
     return message
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_attachment():
-    """Create a mock Discord image attachment."""
-    attachment = MagicMock()
-    attachment.url = "https://example.com/image.png"
-    attachment.content_type = "image/png"
-    attachment.filename = "image.png"
-    attachment.size = 1024
-    return attachment
+    """Create a mock Discord image attachment.
+
+    Session-scoped because no test mutates it; request mock_file_attachment or
+    build a local mock when a test needs to change attachment fields.
+    """
+    return SimpleNamespace(
+        url="https://example.com/image.png",
+        content_type="image/png",
+        filename="image.png",
+        size=1024,
+    )
 
 
 @pytest.fixture
 def mock_file_attachment():
     """Create a mock Discord file attachment (non-image)."""
-    attachment = MagicMock()
-    attachment.url = "https://example.com/document.pdf"
-    attachment.content_type = "application/pdf"
-    attachment.filename = "document.pdf"
-    attachment.size = 2048
-    return attachment
+    return SimpleNamespace(
+        url="https://example.com/document.pdf",
+        content_type="application/pdf",
+        filename="document.pdf",
+        size=2048,
+    )
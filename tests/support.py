@@ -1,21 +1,28 @@
 import copy
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call
 
 from tests.fixtures import MOCK_RESPONSES_API_RESPONSE
 
 
 def make_raw_cog(mock_bot):
-    """Helper to create a GrokCog without overriding runtime methods."""
-    with patch("xai_sdk.AsyncClient"):
-        from discord_grok import GrokCog
+    """Helper to create a GrokCog without overriding runtime methods.
 
-        return GrokCog(bot=mock_bot)
+    GrokCog builds its xAI client lazily, so construction needs no SDK patch.
+    """
+    from discord_grok import GrokCog
 
+    return GrokCog(bot=mock_bot)
 
-def make_cog(mock_bot, mock_api_response=None):
-    """Helper to create a cog with _call_responses_api mocked."""
+
+def make_cog(mock_bot, mock_api_response=None, *, client=None):
+    """Helper to create a cog with _call_responses_api mocked.
+
+    Pass ``client`` to inject an already-built xAI client mock.
+    """
     cog = make_raw_cog(mock_bot)
+    if client is not None:
+        cog.client = client
 
     if mock_api_response is None:
         mock_api_response = copy.deepcopy(MOCK_RESPONSES_API_RESPONSE)
@@ -36,6 +43,29 @@ def make_http_response(
     return response
 
 
+def make_attachment(filename: str, content_type: str = "application/pdf", *, size: int = 1024):
+    """Build a Discord attachment mock served from ``https://example.com/<filename>``."""
+    attachment = MagicMock()
+    attachment.filename = filename
+    attachment.content_type = content_type
+    attachment.size = size
+    attachment.url = f"https://example.com/{filename}"
+    return attachment
+
+
+def make_download_response(body: bytes, status: int = 200, *, chunk_size: int = 4):
+    """Build a GET response whose body streams through ``content.iter_chunked``."""
+
+    async def iter_chunked(_size):
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    response = MagicMock()
+    response.status = status
+    response.content.iter_chunked = MagicMock(side_effect=iter_chunked)
+    return response
+
+
 class MockPostContextManager:
     def __init__(self, *, response=None, exc: Exception | None = None):
         self.response = response
@@ -61,3 +91,23 @@ class MockHTTPSession:
         if isinstance(result, Exception):
             return MockPostContextManager(exc=result)
         return MockPostContextManager(response=result)
+
+
+class MockAsyncCallable:
+    """Awaitable that records its calls; a lighter AsyncMock for reply assertions."""
+
+    def __init__(self):
+        self.calls: list[Any] = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append(call(*args, **kwargs))
+
+    @property
+    def call_args(self):
+        return self.calls[-1] if self.calls else None
+
+    def assert_called_once(self):
+        assert len(self.calls) == 1, f"Expected one call, got {len(self.calls)}"
+
+    def reset_mock(self):
+        self.calls.clear()
@@ -3,9 +3,12 @@ from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
 import pytest
+from discord import CategoryChannel, DMChannel, TextChannel, Thread
 from discord.ui import Select
 
 from discord_grok.cogs.grok.tooling import SELECTABLE_TOOLS, TOOL_BUILDERS, TOOL_REGISTRY
+from discord_grok.cogs.grok.views import ButtonView
+from tests.support import MockAsyncCallable
 
 
 def _make_view(
@@ -16,8 +19,6 @@ def _make_view(
     on_tools_changed=None,
     on_stop=None,
 ):
-    from discord_grok.cogs.grok.views import ButtonView
-
     return ButtonView(
         conversation_starter=conversation_starter or MagicMock(),
         conversation_id=conversation_id or 111,
@@ -48,16 +49,17 @@ class TestButtonView:
         user.id = 12345
         return user
 
-    async def test_init_adds_tool_select(self, conversation_starter):
-        view = _make_view(conversation_starter=conversation_starter)
+    @pytest.fixture
+    def view(self, conversation_starter):
+        return _make_view(conversation_starter=conversation_starter)
 
+    async def test_init_adds_tool_select(self, view):
         selects = [item for item in view.children if isinstance(item, Select)]
         assert len(selects) == 1
         assert selects[0].min_values == 0
         assert selects[0].max_values == len(SELECTABLE_TOOLS)
 
-    async def test_tool_select_options_match_registry(self, conversation_starter):
-        view = _make_view(conversation_starter=conversation_starter)
+    async def test_tool_select_options_match_registry(self, view):
         tool_select = next(item for item in view.children if isinstance(item, Select))
 
         assert {option.value for option in tool_select.options} == set(SELECTABLE_TOOLS)
@@ -104,7 +106,7 @@ class TestButtonView:
         interaction = MagicMock()
         interaction.user = conversation_starter
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
         interaction.response.is_done = MagicMock(return_value=False)
 
         await view.tool_select_callback(interaction, mock_select)
@@ -112,7 +114,8 @@ class TestButtonView:
         on_tools_changed.assert_called_once_with(["web_search", "code_execution"], conversation)
 
         call_args = interaction.response.send_message.call_args
-        assert "Tools updated" in call_args.args[0]
+        # Names are reported in dropdown order, not alphabetically.
+        assert call_args.args[0] == "Tools updated: web_search, code_execution."
         assert call_args.kwargs["ephemeral"] is True
 
         # Verify Select defaults were updated on the real widget
@@ -121,15 +124,38 @@ class TestButtonView:
         assert defaults["code_execution"] is True
         assert defaults["x_search"] is False
 
-    async def test_tool_select_callback_rejects_non_owner(self, conversation_starter):
-        view = _make_view(conversation_starter=conversation_starter)
+    @pytest.mark.parametrize(
+        ("raw_values", "expected"),
+        [(None, []), (["mcp", "web_search", "bogus"], ["web_search"])],
+    )
+    async def test_tool_select_callback_filters_values(
+        self, conversation_starter, raw_values, expected
+    ):
+        conversation = MagicMock()
+        on_tools_changed = MagicMock(return_value=(set(expected), None))
+        view = _make_view(
+            conversation_starter=conversation_starter,
+            get_conversation=MagicMock(return_value=conversation),
+            on_tools_changed=on_tools_changed,
+        )
+
+        interaction = MagicMock()
+        interaction.user = conversation_starter
+        interaction.response = MagicMock()
+        interaction.response.send_message = MockAsyncCallable()
+
+        await view.tool_select_callback(interaction, MagicMock(values=raw_values))
+
+        on_tools_changed.assert_called_once_with(expected, conversation)
+
+    async def test_tool_select_callback_rejects_non_owner(self, view):
         mock_select = MagicMock()
         mock_select.values = []
 
         interaction = MagicMock()
         interaction.user = MagicMock()
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         await view.tool_select_callback(interaction, mock_select)
 
@@ -152,7 +178,7 @@ class TestButtonView:
         interaction = MagicMock()
         interaction.user = conversation_starter
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         await view.tool_select_callback(interaction, mock_select)
 
@@ -173,7 +199,7 @@ class TestButtonView:
         interaction = MagicMock()
         interaction.user = conversation_starter
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
         interaction.response.is_done = MagicMock(return_value=False)
 
         await view.stop_button.callback(interaction)
@@ -182,26 +208,36 @@ class TestButtonView:
         call_args = interaction.response.send_message.call_args
         assert "Conversation ended" in call_args.args[0]
 
-    async def test_stop_button_rejects_non_owner(self, conversation_starter):
-        view = _make_view(conversation_starter=conversation_starter)
+    async def test_permission_check_matches_starter_by_id(self, view, conversation_starter):
+        """A different User/Member object for the same account is still the owner."""
+        same_user = MagicMock()
+        same_user.id = conversation_starter.id
+
+        interaction = MagicMock()
+        interaction.user = same_user
+        interaction.response = MagicMock()
+        interaction.response.send_message = MockAsyncCallable()
+
+        await view.tool_select_callback(interaction, MagicMock(values=[]))
+
+        assert "No active conversation" in interaction.response.send_message.call_args.args[0]
 
+    async def test_stop_button_rejects_non_owner(self, view):
         interaction = MagicMock()
         interaction.user = MagicMock()
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         await view.stop_button.callback(interaction)
 
         call_args = interaction.response.send_message.call_args
         assert "not allowed" in call_args.args[0]
 
-    async def test_stop_button_no_conversation(self, conversation_starter):
-        view = _make_view(conversation_starter=conversation_starter)
-
+    async def test_stop_button_no_conversation(self, view, conversation_starter):
         interaction = MagicMock()
         interaction.user = conversation_starter
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         await view.stop_button.callback(interaction)
 
@@ -221,7 +257,7 @@ class TestButtonView:
         interaction = MagicMock()
         interaction.user = conversation_starter
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
         interaction.response.is_done = MagicMock(return_value=False)
 
         await view.play_pause_button.callback(interaction)
@@ -233,52 +269,44 @@ class TestButtonView:
         assert conversation.params.paused is False
         assert "resumed" in interaction.response.send_message.call_args.args[0]
 
-    async def test_play_pause_rejects_non_owner(self, conversation_starter):
-        view = _make_view(conversation_starter=conversation_starter)
-
+    async def test_play_pause_rejects_non_owner(self, view):
         interaction = MagicMock()
         interaction.user = MagicMock()
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         await view.play_pause_button.callback(interaction)
 
         call_args = interaction.response.send_message.call_args
         assert "not allowed" in call_args.args[0]
 
-    async def test_play_pause_no_conversation(self, conversation_starter):
-        view = _make_view(conversation_starter=conversation_starter)
-
+    async def test_play_pause_no_conversation(self, view, conversation_starter):
         interaction = MagicMock()
         interaction.user = conversation_starter
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         await view.play_pause_button.callback(interaction)
 
         call_args = interaction.response.send_message.call_args
         assert "No active conversation" in call_args.args[0]
 
-    async def test_regenerate_rejects_non_owner(self, conversation_starter):
-        view = _make_view(conversation_starter=conversation_starter)
-
+    async def test_regenerate_rejects_non_owner(self, view):
         interaction = MagicMock()
         interaction.user = MagicMock()
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         await view.regenerate_button.callback(interaction)
 
         call_args = interaction.response.send_message.call_args
         assert "not allowed" in call_args.args[0]
 
-    async def test_regenerate_no_conversation(self, conversation_starter):
-        view = _make_view(conversation_starter=conversation_starter)
-
+    async def test_regenerate_no_conversation(self, view, conversation_starter):
         interaction = MagicMock()
         interaction.user = conversation_starter
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         await view.regenerate_button.callback(interaction)
 
@@ -307,15 +335,101 @@ class TestButtonView:
         call_args = interaction.followup.send.call_args
         assert "Not enough history" in call_args.args[0]
 
-    async def test_tool_select_no_conversation(self, conversation_starter):
-        view = _make_view(conversation_starter=conversation_starter)
+    @pytest.mark.parametrize("channel_cls", [TextChannel, Thread, DMChannel])
+    async def test_regenerate_stops_at_first_starter_message(
+        self, conversation_starter, channel_cls
+    ):
+        conversation = MagicMock()
+        conversation.response_id_history = ["resp_1", "resp_2"]
+        view = _make_view(
+            conversation_starter=conversation_starter,
+            get_conversation=MagicMock(return_value=conversation),
+        )
+
+        other_message = MagicMock(author=MagicMock())
+        starter_message = MagicMock(author=conversation_starter)
+        older_message = MagicMock(author=conversation_starter)
+        yielded = []
+
+        async def history(limit):
+            for message in (other_message, starter_message, older_message):
+                yielded.append(message)
+                yield message
+
+        interaction = MagicMock()
+        interaction.user = conversation_starter
+        interaction.channel = MagicMock(spec=channel_cls)
+        interaction.channel.history = history
+        interaction.response = MagicMock()
+        interaction.response.defer = AsyncMock()
+        interaction.followup = MagicMock()
+        interaction.followup.send = AsyncMock()
+
+        await view.regenerate_button.callback(interaction)
+
+        view._on_regenerate.assert_awaited_once_with(starter_message, conversation)
+        assert yielded == [other_message, starter_message]
+        assert conversation.response_id_history == ["resp_1"]
+        assert conversation.previous_response_id == "resp_1"
+
+    async def test_regenerate_rejects_channel_without_history(self, conversation_starter):
+        conversation = MagicMock()
+        conversation.response_id_history = ["resp_1"]
+        view = _make_view(
+            conversation_starter=conversation_starter,
+            get_conversation=MagicMock(return_value=conversation),
+        )
+
+        interaction = MagicMock()
+        interaction.user = conversation_starter
+        interaction.channel = MagicMock(spec=CategoryChannel)
+        interaction.response = MagicMock()
+        interaction.response.defer = AsyncMock()
+        interaction.followup = MagicMock()
+        interaction.followup.send = AsyncMock()
+
+        await view.regenerate_button.callback(interaction)
+
+        view._on_regenerate.assert_not_awaited()
+        assert conversation.response_id_history == ["resp_1"]
+        assert "Couldn't find the message" in interaction.followup.send.call_args.args[0]
+
+    async def test_regenerate_without_starter_message_keeps_history(self, conversation_starter):
+        conversation = MagicMock()
+        conversation.response_id_history = ["resp_1", "resp_2"]
+        conversation.previous_response_id = "resp_2"
+        view = _make_view(
+            conversation_starter=conversation_starter,
+            get_conversation=MagicMock(return_value=conversation),
+        )
+
+        async def history(limit):
+            yield MagicMock(author=MagicMock())
+
+        interaction = MagicMock()
+        interaction.user = conversation_starter
+        interaction.channel = MagicMock(spec=TextChannel)
+        interaction.channel.history = history
+        interaction.response = MagicMock()
+        interaction.response.defer = AsyncMock()
+        interaction.followup = MagicMock()
+        interaction.followup.send = AsyncMock()
+
+        await view.regenerate_button.callback(interaction)
+
+        view._on_regenerate.assert_not_awaited()
+        assert conversation.response_id_history == ["resp_1", "resp_2"]
+        assert conversation.previous_response_id == "resp_2"
+        assert "Couldn't find the message" in interaction.followup.send.call_args.args[0]
+
+    async def test_tool_select_no_conversation(self, view, conversation_starter):
         mock_select = MagicMock()
         mock_select.values = []
 
         interaction = MagicMock()
         interaction.user = conversation_starter
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         await view.tool_select_callback(interaction, mock_select)
 
@@ -336,7 +450,7 @@ class TestButtonView:
         interaction = MagicMock()
         interaction.user = conversation_starter
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         with pytest.raises(asyncio.CancelledError):
             await view.tool_select_callback(interaction, mock_select)
@@ -356,7 +470,7 @@ class TestButtonView:
         interaction.user = conversation_starter
         interaction.response = MagicMock()
         interaction.response.is_done = MagicMock(return_value=False)
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         await view.stop_button.callback(interaction)
 
@@ -376,7 +490,7 @@ class TestButtonView:
         interaction = MagicMock()
         interaction.user = conversation_starter
         interaction.response = MagicMock()
-        interaction.response.send_message = AsyncMock()
+        interaction.response.send_message = MockAsyncCallable()
 
         with pytest.raises(RuntimeError, match="kaboom"):
             await view.stop_button.callback(interaction)
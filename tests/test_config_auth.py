@@ -35,7 +35,7 @@ def test_parses_ids_with_whitespace_and_empty_segments(monkeypatch):
     )
 
     assert auth_config.GUILD_IDS == [123, 456, 789]
-    assert auth_config.XAI_COLLECTION_IDS == ["alpha", "beta", "gamma"]
+    assert auth_config.XAI_COLLECTION_IDS == ("alpha", "beta", "gamma")
 
 
 def test_parses_ids_with_trailing_commas(monkeypatch):
@@ -46,7 +46,7 @@ def test_parses_ids_with_trailing_commas(monkeypatch):
     )
 
     assert auth_config.GUILD_IDS == [111, 222]
-    assert auth_config.XAI_COLLECTION_IDS == ["collection_a", "collection_b"]
+    assert auth_config.XAI_COLLECTION_IDS == ("collection_a", "collection_b")
 
 
 def test_validate_required_config_rejects_whitespace_only_values(monkeypatch):
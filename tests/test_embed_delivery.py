@@ -1,10 +1,10 @@
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-import pytest
 from discord import Embed
 
 from discord_grok.cogs.grok.embed_delivery import (
+    DISCORD_EMBED_DESCRIPTION_LIMIT,
     DISCORD_EMBED_TOTAL_LIMIT,
     count_embed_chars,
     pack_embeds,
@@ -47,7 +47,6 @@ def test_pack_embeds_splits_more_than_ten_embeds():
     assert [len(batch) for batch in batches] == [10, 1]
 
 
-@pytest.mark.asyncio
 async def test_send_embed_batches_attaches_view_only_to_final_batch():
     send = AsyncMock(side_effect=["first", "second"])
     view = object()
@@ -66,7 +65,6 @@ async def test_send_embed_batches_attaches_view_only_to_final_batch():
     assert second_kwargs["view"] is view
 
 
-@pytest.mark.asyncio
 async def test_send_embed_batches_attaches_files_to_referencing_batch():
     send = AsyncMock(side_effect=["first", "second"])
     first_embed = Embed(description="a" * 4000)
@@ -88,7 +86,6 @@ async def test_send_embed_batches_attaches_files_to_referencing_batch():
     assert second_kwargs["files"] == [referenced]
 
 
-@pytest.mark.asyncio
 async def test_send_embed_batches_preserves_single_file_kwarg_when_possible():
     send = AsyncMock(return_value="message")
     file = SimpleNamespace(filename="audio.mp3")
@@ -102,3 +99,20 @@ async def test_send_embed_batches_preserves_single_file_kwarg_when_possible():
     assert result == "message"
     assert send.await_args.kwargs["file"] is file
     assert "files" not in send.await_args.kwargs
+
+
+async def test_send_embed_batches_sends_oversized_embed_as_text_without_trying_embed():
+    send = AsyncMock(return_value="message")
+    view = object()
+
+    result = await send_embed_batches(
+        send,
+        embed=Embed(title="Long", description="x" * (DISCORD_EMBED_DESCRIPTION_LIMIT + 1)),
+        view=view,
+    )
+
+    assert result == "message"
+    assert all("embed" not in call.kwargs for call in send.await_args_list)
+    assert all("embeds" not in call.kwargs for call in send.await_args_list)
+    assert send.await_args_list[0].kwargs["content"].startswith("**Long**")
+    assert send.await_args_list[-1].kwargs["view"] is view
@@ -1,11 +1,13 @@
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
 
 import aiohttp
 import pytest
 
-from tests.support import make_cog
+from discord_grok.cogs.grok.state import register_conversation
+from tests.support import make_attachment, make_cog
 
 
 class TestGrokChat:
@@ -17,10 +19,6 @@ class TestGrokChat:
 
     async def test_chat_creates_conversation(self, cog, mock_discord_context):
         """Test that chat command creates a conversation entry."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -42,10 +40,6 @@ class TestGrokChat:
 
     async def test_chat_stores_response_id(self, cog, mock_discord_context):
         """Chat should store the response ID for multi-turn."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -92,10 +86,6 @@ class TestGrokChat:
         cog = make_cog(mock_bot, response)
         cog.show_cost_embeds = True
         mock_discord_context.send_followup = AsyncMock(return_value="message")
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -115,10 +105,6 @@ class TestGrokChat:
 
     async def test_chat_with_four_tools(self, cog, mock_discord_context):
         """Chat should pass the selected four tools in the payload."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         with patch("discord_grok.cogs.grok.tooling.XAI_COLLECTION_IDS", ["collection_123"]):
             await cog.chat.callback(
                 cog,
@@ -147,10 +133,6 @@ class TestGrokChat:
         """Chat should resolve MCP presets into Responses payload tools."""
         from discord_grok.config.mcp import XaiMcpPreset
 
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         with patch.dict(
             "discord_grok.config.mcp.XAI_MCP_PRESETS",
             {
@@ -182,10 +164,6 @@ class TestGrokChat:
 
     async def test_chat_rejects_unknown_mcp_preset(self, cog, mock_discord_context):
         """Unknown MCP preset names should return a user-facing error."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -207,7 +185,7 @@ class TestGrokChat:
             channel_id=mock_discord_context.channel.id,
             conversation_id=123,
         )
-        cog.conversations[123] = Conversation(params=existing_params)
+        register_conversation(cog, 123, Conversation(params=existing_params))
 
         await cog.chat.callback(
             cog,
@@ -223,10 +201,6 @@ class TestGrokChat:
         """Chat should use the shared default model."""
         from discord_grok.cogs.grok.command_options import DEFAULT_CHAT_MODEL_ID
 
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -240,10 +214,6 @@ class TestGrokChat:
         self, cog, mock_discord_context
     ):
         """frequency_penalty should be rejected for reasoning models."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -258,10 +228,6 @@ class TestGrokChat:
 
     async def test_chat_rejects_both_penalties_on_reasoning_model(self, cog, mock_discord_context):
         """Both penalties set on a reasoning model should be rejected."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -277,10 +243,6 @@ class TestGrokChat:
 
     async def test_chat_allows_penalty_on_non_reasoning_model(self, cog, mock_discord_context):
         """Penalty params should be allowed for non-reasoning models."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -296,10 +258,6 @@ class TestGrokChat:
         self, cog, mock_discord_context
     ):
         """reasoning_effort should be rejected for models that don't support it."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -315,10 +273,6 @@ class TestGrokChat:
         self, cog, mock_discord_context
     ):
         """reasoning_effort should be passed to the API for grok-4.3."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -332,10 +286,6 @@ class TestGrokChat:
 
     async def test_chat_passes_none_effort_for_grok_4_3(self, cog, mock_discord_context):
         """grok-4.3 accepts `none` per its spec; should be forwarded unchanged."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -351,10 +301,6 @@ class TestGrokChat:
         """`none` is a selectable menu choice but the default model (grok-4.5) cannot
         disable reasoning — the per-model effort check must reject it BEFORE the API
         call, else every `/grok chat reasoning_effort:None` with no model is a live 400."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -371,10 +317,6 @@ class TestGrokChat:
 
     async def test_chat_rejects_max_tokens_on_multi_agent(self, cog, mock_discord_context):
         """max_tokens should be rejected for multi-agent models."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -389,10 +331,6 @@ class TestGrokChat:
 
     async def test_chat_rejects_agent_count_on_non_multi_agent(self, cog, mock_discord_context):
         """agent_count should be rejected for non-multi-agent models."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -407,10 +345,6 @@ class TestGrokChat:
 
     async def test_chat_passes_agent_count_for_multi_agent(self, cog, mock_discord_context):
         """agent_count should be passed to the API for multi-agent models."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -425,10 +359,6 @@ class TestGrokChat:
 
     async def test_chat_multi_agent_sets_encrypted_content(self, cog, mock_discord_context):
         """Multi-agent model should always set include with encrypted content."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -442,10 +372,6 @@ class TestGrokChat:
 
     async def test_chat_tools_set_encrypted_content(self, cog, mock_discord_context):
         """Tool-using conversations should include encrypted content."""
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
-
         await cog.chat.callback(
             cog,
             ctx=mock_discord_context,
@@ -490,14 +416,10 @@ class TestHandleNewMessageInConversation:
         msg = MagicMock()
         msg.author = conversation.params.conversation_starter
         msg.author.id = 111222333
-        msg.channel = MagicMock()
-        msg.channel.id = 444555666
+        msg.channel = SimpleNamespace(id=444555666, trigger_typing=AsyncMock())
         msg.content = "Follow-up message"
         msg.attachments = []
         msg.reply = AsyncMock()
-        msg.channel.typing = MagicMock()
-        msg.channel.typing.return_value.__aenter__ = AsyncMock()
-        msg.channel.typing.return_value.__aexit__ = AsyncMock()
         return msg
 
     async def test_follow_up_sends_response(self, cog, message, conversation):
@@ -554,12 +476,7 @@ class TestHandleNewMessageInConversation:
 
     async def test_unsupported_image_attachment_returns_error(self, cog, message, conversation):
         """Unsupported image MIME types should return an error before calling xAI."""
-        attachment = MagicMock()
-        attachment.content_type = "image/webp"
-        attachment.filename = "scene.webp"
-        attachment.size = 1024
-        attachment.url = "https://example.com/scene.webp"
-        message.attachments = [attachment]
+        message.attachments = [make_attachment("scene.webp", "image/webp")]
 
         with patch.object(cog, "_upload_file_attachment", new_callable=AsyncMock) as mock_upload:
             await cog.handle_new_message_in_conversation(message, conversation)
@@ -570,6 +487,95 @@ class TestHandleNewMessageInConversation:
         embed = message.reply.call_args[1]["embed"]
         assert "supports only JPEG and PNG" in embed.description
 
+    async def test_file_attachments_upload_concurrently_in_message_order(
+        self, cog, message, conversation
+    ):
+        """Non-image attachments upload in parallel; content keeps attachment order."""
+        first = make_attachment("a.pdf", "application/pdf")
+        image = make_attachment("b.png", "image/png")
+        second = make_attachment("c.txt", "text/plain")
+        message.attachments = [first, image, second]
+
+        started: list[str] = []
+        both_started = asyncio.Event()
+
+        async def upload(attachment):
+            started.append(attachment.filename)
+            if len(started) == 2:
+                both_started.set()
+            # Serial uploads would never reach the second start and time out here.
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return f"file-{attachment.filename}"
+
+        with patch.object(cog, "_upload_file_attachment", side_effect=upload):
+            await cog.handle_new_message_in_conversation(message, conversation)
+
+        payload = cog._call_responses_api.call_args.args[0]
+        content = payload["input"][0]["content"]
+        assert [part["type"] for part in content] == [
+            "input_text",
+            "input_file",
+            "input_image",
+            "input_file",
+        ]
+        assert content[1]["file_id"] == "file-a.pdf"
+        assert content[3]["file_id"] == "file-c.txt"
+        assert conversation.file_ids == ["file-a.pdf", "file-c.txt"]
+
+    async def test_failed_attachment_fetch_keeps_sibling_upload(
+        self, cog, message, conversation, mock_xai_client
+    ):
+        """A fetch timeout on one file must not drop a sibling's uploaded id."""
+        stalled = make_attachment("stalled.pdf")
+        uploaded = make_attachment("uploaded.pdf")
+        message.attachments = [stalled, uploaded]
+        cog.client = mock_xai_client
+
+        async def fetch(attachment):
+            if attachment is stalled:
+                raise TimeoutError
+            return b"file content"
+
+        with patch.object(cog, "_fetch_attachment_bytes", side_effect=fetch):
+            await cog.handle_new_message_in_conversation(message, conversation)
+
+        mock_xai_client.files.upload.assert_awaited_once()
+        assert conversation.file_ids == ["file-abc123"]
+        content = cog._call_responses_api.call_args.args[0]["input"][0]["content"]
+        assert [part["type"] for part in content] == ["input_text", "input_file"]
+        assert content[1]["file_id"] == "file-abc123"
+
+    async def test_raising_upload_does_not_abort_sibling_uploads(self, cog, message, conversation):
+        """An exception escaping one upload still records the ids of the others."""
+        from discord_grok.cogs.grok.chat import MAX_CONCURRENT_FILE_UPLOADS
+
+        attachments = [
+            make_attachment(f"doc{index}.pdf") for index in range(MAX_CONCURRENT_FILE_UPLOADS + 2)
+        ]
+        message.attachments = attachments
+
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def upload(attachment):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if attachment is attachments[0]:
+                raise RuntimeError("boom")
+            return f"file-{attachment.filename}"
+
+        with patch.object(cog, "_upload_file_attachment", side_effect=upload):
+            await cog.handle_new_message_in_conversation(message, conversation)
+
+        expected_ids = [f"file-{attachment.filename}" for attachment in attachments[1:]]
+        assert sorted(conversation.file_ids) == expected_ids
+        assert peak_in_flight <= MAX_CONCURRENT_FILE_UPLOADS
+        content = cog._call_responses_api.call_args.args[0]["input"][0]["content"]
+        assert [part["file_id"] for part in content[1:]] == expected_ids
+
     async def test_follow_up_cancellation_propagates(self, cog, message, conversation):
         """CancelledError should not be swallowed in async follow-up handling."""
         cog._call_responses_api.side_effect = asyncio.CancelledError()
@@ -618,13 +624,32 @@ class TestOnMessageRouting:
             channel_id=mock_discord_message.channel.id,
             conversation_id=111,
         )
-        cog.conversations[111] = Conversation(params=params, prompt_cache_key="k")
+        register_conversation(cog, 111, Conversation(params=params, prompt_cache_key="k"))
         cog.handle_new_message_in_conversation = AsyncMock()
 
         await cog.on_message(mock_discord_message)
 
         cog.handle_new_message_in_conversation.assert_awaited_once()
 
+    async def test_ended_conversation_no_longer_routes(self, cog, mock_discord_message):
+        """Ending a conversation should drop it from the routing index."""
+        from discord_grok.cogs.grok.tooling import ChatCompletionParameters, Conversation
+
+        params = ChatCompletionParameters(
+            model="grok-4.3",
+            conversation_starter=mock_discord_message.author,
+            channel_id=mock_discord_message.channel.id,
+            conversation_id=111,
+        )
+        register_conversation(cog, 111, Conversation(params=params, prompt_cache_key="k"))
+        cog.handle_new_message_in_conversation = AsyncMock()
+
+        await cog.end_conversation(111)
+        await cog.on_message(mock_discord_message)
+
+        assert cog.conversation_index == {}
+        cog.handle_new_message_in_conversation.assert_not_awaited()
+
     async def test_wrong_channel_skipped(self, cog, mock_discord_message):
         """Message in a different channel should not route."""
         from discord_grok.cogs.grok.tooling import ChatCompletionParameters, Conversation
@@ -636,7 +661,7 @@ class TestOnMessageRouting:
             channel_id=999999,
             conversation_id=111,
         )
-        cog.conversations[111] = Conversation(params=params, prompt_cache_key="k")
+        register_conversation(cog, 111, Conversation(params=params, prompt_cache_key="k"))
         cog.handle_new_message_in_conversation = AsyncMock()
 
         await cog.on_message(mock_discord_message)
@@ -655,7 +680,27 @@ class TestOnMessageRouting:
             channel_id=mock_discord_message.channel.id,
             conversation_id=111,
         )
-        cog.conversations[111] = Conversation(params=params, prompt_cache_key="k")
+        register_conversation(cog, 111, Conversation(params=params, prompt_cache_key="k"))
+        cog.handle_new_message_in_conversation = AsyncMock()
+
+        await cog.on_message(mock_discord_message)
+
+        cog.handle_new_message_in_conversation.assert_not_awaited()
+
+    async def test_bot_authored_message_skipped_with_active_conversation(
+        self, cog, mock_discord_message
+    ):
+        """The bot's own messages should never route, even into a matching conversation."""
+        from discord_grok.cogs.grok.tooling import ChatCompletionParameters, Conversation
+
+        mock_discord_message.author = cog.bot.user
+        params = ChatCompletionParameters(
+            model="grok-4.3",
+            conversation_starter=cog.bot.user,
+            channel_id=mock_discord_message.channel.id,
+            conversation_id=111,
+        )
+        register_conversation(cog, 111, Conversation(params=params, prompt_cache_key="k"))
         cog.handle_new_message_in_conversation = AsyncMock()
 
         await cog.on_message(mock_discord_message)
@@ -1,10 +1,44 @@
 import json
 from unittest.mock import AsyncMock, patch
 
+import aiohttp
 import pytest
 
-from discord_grok.cogs.grok.client import XaiApiError
-from tests.support import MockHTTPSession, make_cog, make_http_response, make_raw_cog
+from discord_grok.cogs.grok.client import (
+    DOWNLOAD_CHUNK_SIZE,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_DNS_CACHE_TTL_SECONDS,
+    HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+    XaiApiError,
+    build_responses_payload,
+    read_response_into_buffer,
+)
+from tests.support import (
+    MockHTTPSession,
+    make_cog,
+    make_download_response,
+    make_http_response,
+    make_raw_cog,
+)
+
+
+class TestBuildResponsesPayload:
+    def test_omits_unset_options_and_keeps_zero_values(self):
+        payload = build_responses_payload(
+            "grok-4.3",
+            [{"role": "user", "content": "hi"}],
+            temperature=0.0,
+            presence_penalty=None,
+            reasoning_effort="high",
+        )
+
+        assert payload == {
+            "model": "grok-4.3",
+            "input": [{"role": "user", "content": "hi"}],
+            "store": True,
+            "temperature": 0.0,
+            "reasoning_effort": "high",
+        }
 
 
 class TestFileUploadAndCleanup:
@@ -13,9 +47,7 @@ class TestFileUploadAndCleanup:
     @pytest.fixture
     def cog(self, mock_bot, mock_xai_client):
         """Create a cog with files API mocked."""
-        cog = make_cog(mock_bot)
-        cog.client = mock_xai_client
-        return cog
+        return make_cog(mock_bot, client=mock_xai_client)
 
     async def test_upload_file_attachment_success(self, cog, mock_file_attachment):
         """Should download from Discord and upload to xAI, returning the file ID."""
@@ -129,6 +161,22 @@ class TestSessionManagement:
         assert session.timeout.connect == 15
         await session.close()
 
+    async def test_get_http_session_tunes_connector(self, cog):
+        """Shared session should pool connections with a DNS cache and long keep-alive."""
+        with patch(
+            "discord_grok.cogs.grok.client.aiohttp.TCPConnector",
+            wraps=aiohttp.TCPConnector,
+        ) as connector_cls:
+            session = await cog._get_http_session()
+
+        connector_cls.assert_called_once_with(
+            limit=HTTP_CONNECTION_LIMIT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL_SECONDS,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+        )
+        assert session.connector.limit == HTTP_CONNECTION_LIMIT
+        await session.close()
+
     async def test_get_http_session_reuses_session(self, cog):
         """Calling _get_http_session twice should return the same session."""
         session1 = await cog._get_http_session()
@@ -136,6 +184,16 @@ class TestSessionManagement:
         assert session1 is session2
         await session1.close()
 
+    async def test_read_response_into_buffer_streams_chunks(self):
+        """Downloads should be assembled chunk by chunk into a rewound buffer."""
+        response = make_download_response(b"0123456789", chunk_size=3)
+
+        buffer = await read_response_into_buffer(response)
+
+        assert buffer.tell() == 0
+        assert buffer.read() == b"0123456789"
+        response.content.iter_chunked.assert_called_once_with(DOWNLOAD_CHUNK_SIZE)
+
 
 class TestGrokHTTPRetries:
     """Tests for shared retry behavior across xAI HTTP endpoints."""
@@ -3,6 +3,7 @@ import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from discord import DiscordException
 
 from tests.support import make_cog
 
@@ -82,15 +83,46 @@ class TestGrokCog:
 
     async def test_keep_typing_can_be_cancelled(self, cog, mock_discord_context):
         """Test that the typing indicator can be cancelled."""
-        typing_cm = MagicMock()
-        typing_cm.__aenter__ = AsyncMock(return_value=None)
-        typing_cm.__aexit__ = AsyncMock(return_value=None)
-        mock_discord_context.channel.typing = MagicMock(return_value=typing_cm)
-
         task = asyncio.create_task(cog.keep_typing(mock_discord_context.channel))
 
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         task.cancel()
 
         with pytest.raises(asyncio.CancelledError):
             await task
+        mock_discord_context.channel.trigger_typing.assert_awaited_once()
+
+    async def test_keep_typing_stops_quietly_on_discord_error(self, cog, mock_discord_context):
+        """A failed typing request should end the loop instead of raising."""
+        mock_discord_context.channel.trigger_typing = AsyncMock(
+            side_effect=DiscordException("typing failed")
+        )
+
+        await asyncio.wait_for(cog.keep_typing(mock_discord_context.channel), timeout=1)
+
+        mock_discord_context.channel.trigger_typing.assert_awaited_once()
+
+    def test_cog_unload_closes_session_on_stopped_bot_loop(self, cog):
+        """A stopped bot loop should be reused instead of creating a fresh one."""
+        loop = asyncio.new_event_loop()
+        try:
+            cog.bot.loop = loop
+            cog._http_session = MagicMock(closed=False)
+            cog._close_http_session = AsyncMock()
+
+            cog.cog_unload()
+
+            cog._close_http_session.assert_awaited_once()
+            assert cog._http_session is None
+        finally:
+            loop.close()
+
+    def test_cog_unload_closes_session_without_bot_loop(self, cog):
+        cog.bot.loop = None
+        cog._http_session = MagicMock(closed=False)
+        cog._close_http_session = AsyncMock()
+
+        cog.cog_unload()
+
+        cog._close_http_session.assert_awaited_once()
+        assert cog._http_session is None
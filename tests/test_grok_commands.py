@@ -2,7 +2,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from tests.support import make_cog
+from tests.support import make_cog, make_download_response, make_raw_cog
 
 
 class TestGrokCommandSchema:
@@ -149,10 +149,7 @@ class TestTTSCommand:
 
     @pytest.fixture
     def cog(self, mock_bot):
-        with patch("xai_sdk.AsyncClient"):
-            from discord_grok import GrokCog
-
-            return GrokCog(bot=mock_bot)
+        return make_raw_cog(mock_bot)
 
     async def test_tts_text_too_long(self, cog, mock_discord_context):
         """Text over 15,000 chars should be rejected."""
@@ -242,16 +239,12 @@ class TestImageBatchGeneration:
     @pytest.fixture
     def cog(self, mock_bot, mock_xai_client):
         """Create a cog with xAI image SDK mocked."""
-        cog = make_cog(mock_bot)
-        cog.client = mock_xai_client
-        return cog
+        return make_cog(mock_bot, client=mock_xai_client)
 
     @staticmethod
     def _mock_http_session():
         """Create a mock HTTP session with a working async context manager for get()."""
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.read = AsyncMock(return_value=b"fake image bytes")
+        mock_resp = make_download_response(b"fake image bytes")
 
         mock_cm = MagicMock()
         mock_cm.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -383,6 +376,34 @@ class TestImageBatchGeneration:
         key = (mock_discord_context.author.id, date.today().isoformat())
         assert abs(_extract_daily_total(cog.daily_costs[key]) - 0.123) < 1e-9
 
+    async def test_image_base64_result_is_decoded(self, cog, mock_discord_context):
+        """Inline base64 results should be decoded into the attached file."""
+        import base64
+
+        inline = MagicMock()
+        inline.url = None
+        inline.base64 = base64.b64encode(b"inline png bytes").decode()
+        inline.cost_usd = None
+        cog.client.image.sample.return_value = inline
+
+        with patch.object(
+            cog,
+            "_get_http_session",
+            new_callable=AsyncMock,
+            return_value=self._mock_http_session(),
+        ) as get_session:
+            await cog.image.callback(
+                cog,
+                ctx=mock_discord_context,
+                prompt="A cat",
+                model="grok-imagine-image",
+                count=1,
+            )
+
+        get_session.return_value.get.assert_not_called()
+        [sent_file] = mock_discord_context.send_followup.call_args.kwargs["files"]
+        assert sent_file.fp.read() == b"inline png bytes"
+
     async def test_image_batch_cost_mixes_sdk_and_yaml_per_result(self, cog, mock_discord_context):
         """Mixed Some/None cost_usd across batch should sum SDK values + YAML fallback per missing."""
         from discord_grok.cogs.grok.tooling import calculate_image_cost
@@ -445,15 +466,11 @@ class TestVideoCommand:
 
     @pytest.fixture
     def cog(self, mock_bot, mock_xai_client):
-        cog = make_cog(mock_bot)
-        cog.client = mock_xai_client
-        return cog
+        return make_cog(mock_bot, client=mock_xai_client)
 
     @staticmethod
     def _mock_http_session():
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.read = AsyncMock(return_value=b"fake video bytes")
+        mock_resp = make_download_response(b"fake video bytes")
 
         mock_cm = MagicMock()
         mock_cm.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -1,14 +1,28 @@
 from unittest.mock import MagicMock
 
+import pytest
 from discord import Colour, Embed
 
+from discord_grok.cogs.grok.embeds import (
+    append_generation_pricing_embed,
+    append_pricing_embed,
+    append_reasoning_embeds,
+    append_response_embeds,
+    append_sources_embed,
+    build_reasoning_embeds,
+    build_response_embeds,
+)
+
+# Long inputs are immutable, so build them once per module rather than per test.
+LONG_REASONING_TEXT = "a" * 4000
+MULTI_PART_RESPONSE_TEXT = "a" * 7500
+VERY_LONG_RESPONSE_TEXT = "a" * 25000
+
 
 class TestAppendPricingEmbed:
     """Tests for the append_pricing_embed helper."""
 
     def test_append_pricing_embed(self):
-        from discord_grok.cogs.grok.embeds import append_pricing_embed
-
         embeds: list[Embed] = []
         append_pricing_embed(embeds, 0.05, 1000, 500, 1.50)
         assert len(embeds) == 1
@@ -19,45 +33,33 @@ class TestAppendPricingEmbed:
         assert embeds[0].colour == Colour(0)
 
     def test_append_pricing_embed_with_reasoning_tokens(self):
-        from discord_grok.cogs.grok.embeds import append_pricing_embed
-
         embeds: list[Embed] = []
         append_pricing_embed(embeds, 0.05, 1000, 500, 1.50, reasoning_tokens=200)
         assert len(embeds) == 1
         assert "200 reasoning" in embeds[0].description
 
     def test_append_pricing_embed_hides_zero_reasoning_tokens(self):
-        from discord_grok.cogs.grok.embeds import append_pricing_embed
-
         embeds: list[Embed] = []
         append_pricing_embed(embeds, 0.05, 1000, 500, 1.50, reasoning_tokens=0)
         assert "reasoning" not in embeds[0].description
 
     def test_append_pricing_embed_with_cached_tokens(self):
-        from discord_grok.cogs.grok.embeds import append_pricing_embed
-
         embeds: list[Embed] = []
         append_pricing_embed(embeds, 0.05, 1000, 500, 1.50, cached_tokens=300)
         assert "300 cached" in embeds[0].description
 
     def test_append_pricing_embed_with_image_tokens(self):
-        from discord_grok.cogs.grok.embeds import append_pricing_embed
-
         embeds: list[Embed] = []
         append_pricing_embed(embeds, 0.05, 1000, 500, 1.50, image_tokens=200)
         assert "200 image" in embeds[0].description
 
     def test_append_pricing_embed_hides_zero_cached_and_image_tokens(self):
-        from discord_grok.cogs.grok.embeds import append_pricing_embed
-
         embeds: list[Embed] = []
         append_pricing_embed(embeds, 0.05, 1000, 500, 1.50, cached_tokens=0, image_tokens=0)
         assert "cached" not in embeds[0].description
         assert "image" not in embeds[0].description
 
     def test_append_pricing_embed_with_tool_usage(self):
-        from discord_grok.cogs.grok.embeds import append_pricing_embed
-
         embeds: list[Embed] = []
         tool_usage = {"SERVER_SIDE_TOOL_WEB_SEARCH": 3, "SERVER_SIDE_TOOL_X_SEARCH": 2}
         append_pricing_embed(embeds, 0.05, 1000, 500, 1.50, tool_usage=tool_usage)
@@ -69,15 +71,11 @@ class TestAppendPricingEmbed:
         assert "tool cost" in desc
 
     def test_append_pricing_embed_no_tool_usage_line(self):
-        from discord_grok.cogs.grok.embeds import append_pricing_embed
-
         embeds: list[Embed] = []
         append_pricing_embed(embeds, 0.05, 1000, 500, 1.50, tool_usage={})
         assert "\n" not in embeds[0].description
 
     def test_append_generation_pricing_embed(self):
-        from discord_grok.cogs.grok.embeds import append_generation_pricing_embed
-
         embeds: list[Embed] = []
         append_generation_pricing_embed(embeds, 0.07, 2.50)
         assert len(embeds) == 1
@@ -89,15 +87,11 @@ class TestAppendReasoningEmbeds:
     """Tests for the append_reasoning_embeds helper."""
 
     def test_no_reasoning(self):
-        from discord_grok.cogs.grok.embeds import append_reasoning_embeds
-
         embeds = []
         append_reasoning_embeds(embeds, "")
         assert len(embeds) == 0
 
     def test_with_reasoning(self):
-        from discord_grok.cogs.grok.embeds import append_reasoning_embeds
-
         embeds = []
         append_reasoning_embeds(embeds, "Some reasoning here")
         assert len(embeds) == 1
@@ -105,11 +99,8 @@ class TestAppendReasoningEmbeds:
         assert embeds[0].description == "||Some reasoning here||"
 
     def test_long_reasoning_truncated(self):
-        from discord_grok.cogs.grok.embeds import append_reasoning_embeds
-
         embeds = []
-        long_text = "a" * 4000
-        append_reasoning_embeds(embeds, long_text)
+        append_reasoning_embeds(embeds, LONG_REASONING_TEXT)
         assert len(embeds) == 1
         assert len(embeds[0].description) < 3600
         assert "[reasoning truncated]" in embeds[0].description
@@ -118,48 +109,56 @@ class TestAppendReasoningEmbeds:
 class TestAppendResponseEmbeds:
     """Tests for the append_response_embeds helper."""
 
-    def test_short_response(self):
-        from discord_grok.cogs.grok.embeds import append_response_embeds
-
+    @pytest.mark.parametrize(
+        ("text", "expected_parts"),
+        [
+            pytest.param("Hello!", 1, id="short"),
+            pytest.param(MULTI_PART_RESPONSE_TEXT, 3, id="chunked"),
+            pytest.param(VERY_LONG_RESPONSE_TEXT, 8, id="very-long-preserved-for-batching"),
+        ],
+    )
+    def test_response_split_into_titled_parts(self, text, expected_parts):
         embeds = []
-        append_response_embeds(embeds, "Hello!")
-        assert len(embeds) == 1
-        assert embeds[0].title == "Response"
-        assert embeds[0].description == "Hello!"
+        append_response_embeds(embeds, text)
+        assert [embed.title for embed in embeds] == [
+            "Response",
+            *(f"Response (Part {index})" for index in range(2, expected_parts + 1)),
+        ]
+        assert "".join(embed.description for embed in embeds) == text
 
-    def test_long_response_chunked(self):
-        from discord_grok.cogs.grok.embeds import append_response_embeds
 
-        embeds = []
-        long_text = "a" * 7500
-        append_response_embeds(embeds, long_text)
-        assert len(embeds) > 1
-        assert embeds[0].title == "Response"
-        assert "Part" in embeds[1].title
+class TestBuildTextEmbeds:
+    """Tests for the list-returning reasoning/response embed builders."""
 
-    def test_very_long_response_preserved_for_delivery_batching(self):
-        from discord_grok.cogs.grok.embeds import append_response_embeds
+    def test_builders_return_new_lists(self):
+        assert build_reasoning_embeds("") == []
+        assert build_response_embeds("") == []
 
-        embeds = []
-        very_long_text = "a" * 25000
-        append_response_embeds(embeds, very_long_text)
-        total_text = "".join(embed.description for embed in embeds)
-        assert total_text == very_long_text
+        embeds = build_reasoning_embeds("why") + build_response_embeds(MULTI_PART_RESPONSE_TEXT)
+        assert [embed.title for embed in embeds] == [
+            "Reasoning",
+            "Response",
+            "Response (Part 2)",
+            "Response (Part 3)",
+        ]
+
+    def test_append_wrappers_extend_existing_list(self):
+        header = Embed(title="Conversation Started")
+        embeds = [header]
+        append_response_embeds(embeds, "Hello!")
+        assert embeds[0] is header
+        assert embeds[1].description == "Hello!"
 
 
 class TestAppendSourcesEmbed:
     """Tests for the append_sources_embed helper."""
 
     def test_empty_citations_no_embed(self):
-        from discord_grok.cogs.grok.embeds import append_sources_embed
-
         embeds = []
         append_sources_embed(embeds, [])
         assert len(embeds) == 0
 
     def test_web_citations_grouped(self):
-        from discord_grok.cogs.grok.embeds import append_sources_embed
-
         citations = [
             {"url": "https://example.com/a", "source": "web"},
             {"url": "https://example.com/b", "source": "web"},
@@ -172,8 +171,6 @@ class TestAppendSourcesEmbed:
         assert "[example.com](https://example.com/b)" in embeds[0].description
 
     def test_long_web_links_are_kept_complete_or_omitted(self):
-        from discord_grok.cogs.grok.embeds import append_sources_embed
-
         first_url = "https://example.com/" + "a" * 3500
         second_url = "https://example.org/" + "b" * 1000
         embeds = []
@@ -190,8 +187,6 @@ class TestAppendSourcesEmbed:
         assert len(embeds[0].description) <= 4000
 
     def test_mixed_sources_have_headings(self):
-        from discord_grok.cogs.grok.embeds import append_sources_embed
-
         citations = [
             {"url": "https://example.com/a", "source": "web"},
             {"url": "https://x.com/i/status/123", "source": "x"},
@@ -202,8 +197,6 @@ class TestAppendSourcesEmbed:
         assert "**X Posts**" in embeds[0].description
 
     def test_single_source_type_no_heading(self):
-        from discord_grok.cogs.grok.embeds import append_sources_embed
-
         citations = [
             {"url": "https://x.com/i/status/1", "source": "x"},
             {"url": "https://x.com/i/status/2", "source": "x"},
@@ -213,8 +206,6 @@ class TestAppendSourcesEmbed:
         assert "**X Posts**" not in embeds[0].description
 
     def test_skips_when_at_embed_limit(self):
-        from discord_grok.cogs.grok.embeds import append_sources_embed
-
         embeds = [MagicMock() for _ in range(10)]
         citations = [{"url": "https://example.com", "source": "web"}]
         append_sources_embed(embeds, citations)
@@ -3,16 +3,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from tests.support import make_raw_cog
+
 
 class TestTrackDailyCost:
     """Tests for the _track_daily_cost method."""
 
     @pytest.fixture
     def cog(self, mock_bot):
-        with patch("xai_sdk.AsyncClient"):
-            from discord_grok import GrokCog
-
-            return GrokCog(bot=mock_bot)
+        return make_raw_cog(mock_bot)
 
     def test_track_daily_cost_accumulates(self, cog):
         daily = cog._track_daily_cost(1, 3.00)
@@ -31,13 +30,10 @@ class TestPruneRuntimeState:
 
     @pytest.fixture
     def cog(self, mock_bot):
-        with patch("xai_sdk.AsyncClient"):
-            from discord_grok import GrokCog
-
-            cog = GrokCog(bot=mock_bot)
-            # cleanup_conversation_files does HTTP; stub it out for state tests.
-            cog._cleanup_conversation_files = AsyncMock()
-            return cog
+        cog = make_raw_cog(mock_bot)
+        # cleanup_conversation_files does HTTP; stub it out for state tests.
+        cog._cleanup_conversation_files = AsyncMock()
+        return cog
 
     def _make_conversation(self, *, starter=None, age: timedelta = timedelta(0)):
         from discord_grok.cogs.grok.models import (
@@ -88,6 +84,33 @@ class TestPruneRuntimeState:
             # Newest-updated survive: ages 0 and 1 (smallest subtracted delta).
             assert {0, 1} == set(cog.conversations)
 
+    async def test_evicted_conversation_leaves_routing_index(self, cog):
+        from discord_grok.cogs.grok.state import (
+            CONVERSATION_TTL,
+            find_conversation,
+            prune_runtime_state,
+            register_conversation,
+        )
+
+        user = MagicMock(spec=["id"])
+        user.id = 7
+        stale = self._make_conversation(starter=user, age=CONVERSATION_TTL * 2)
+        stale.params.channel_id = 100
+        fresh = self._make_conversation(starter=user)
+        fresh.params.channel_id = 200
+        register_conversation(cog, 1, stale)
+        register_conversation(cog, 2, fresh)
+
+        with patch(
+            "discord_grok.cogs.grok.state.cleanup_conversation_files",
+            new=AsyncMock(),
+        ):
+            await prune_runtime_state(cog)
+
+        assert find_conversation(cog, 100, 7) is None
+        assert find_conversation(cog, 200, 7) is fresh
+        assert cog.conversation_index == {(200, 7): 2}
+
     async def test_cascade_cleans_orphaned_views(self, cog):
         from discord_grok.cogs.grok.state import CONVERSATION_TTL, prune_runtime_state
 
@@ -107,6 +130,22 @@ class TestPruneRuntimeState:
 
         assert user not in cog.views
 
+    async def test_drops_view_messages_without_a_live_view(self, cog):
+        from discord_grok.cogs.grok.state import prune_runtime_state
+
+        viewless_user = MagicMock(spec=["id"])
+        active_user = MagicMock(spec=["id"])
+        cog.conversations[5] = self._make_conversation(starter=active_user)
+        active_view = MagicMock()
+        active_view.conversation_id = 5
+        cog.views[active_user] = active_view
+        cog.last_view_messages[viewless_user] = MagicMock()
+        cog.last_view_messages[active_user] = MagicMock()
+
+        await prune_runtime_state(cog)
+
+        assert list(cog.last_view_messages) == [active_user]
+
     async def test_prunes_daily_costs_older_than_retention(self, cog):
         from discord_grok.cogs.grok.state import (
             DAILY_COST_RETENTION_DAYS,
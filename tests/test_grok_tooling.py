@@ -219,3 +219,29 @@ class TestResolveSelectedToolsUtil:
             assert error is None
             assert len(tools) == 1
             assert resolve_tool_name(tools[0]) == tool_name
+
+    def test_tool_name_sets_pin_selectable_and_available_tools(self):
+        from discord_grok.cogs.grok.tooling import AVAILABLE_TOOL_NAMES, SELECTABLE_TOOL_NAMES
+
+        assert {
+            "web_search",
+            "x_search",
+            "code_execution",
+            "collections_search",
+        } == SELECTABLE_TOOL_NAMES
+        assert SELECTABLE_TOOL_NAMES | {"mcp"} == AVAILABLE_TOOL_NAMES
+
+    def test_resolve_tools_for_view_drops_mcp_and_unknown_values(self):
+        from discord_grok.cogs.grok.models import ChatCompletionParameters, Conversation
+        from discord_grok.cogs.grok.state import resolve_tools_for_view
+
+        conversation = Conversation(params=ChatCompletionParameters(model="grok-4.3"))
+        cog = make_cog(MagicMock())
+
+        active_names, error = resolve_tools_for_view(
+            cog, ["web_search", "mcp", "not_a_tool"], conversation
+        )
+
+        assert error is None
+        assert active_names == {"web_search"}
+        assert [tool["type"] for tool in conversation.params.tools] == ["web_search"]
@@ -4,8 +4,6 @@ import json
 import logging
 from io import StringIO
 
-import pytest
-
 from discord_grok.logging_setup import (
     REQUEST_ID,
     _JsonFormatter,
@@ -93,7 +91,6 @@ def test_text_format_includes_request_id_bracket(monkeypatch, caplog):
     assert "hello world" in output
 
 
-@pytest.mark.asyncio
 async def test_request_id_is_isolated_between_tasks():
     """Each asyncio task gets its own request-id copy of the ContextVar."""
     import asyncio
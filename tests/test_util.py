@@ -28,78 +28,61 @@ from discord_grok.cogs.grok.tooling import (
     validate_mcp_server_input,
 )
 
+THREE_CHUNK_TEXT = "a" * (CHUNK_TEXT_SIZE * 2 + 100)
+
 
 class TestChunkText:
     """Tests for the chunk_text function."""
 
-    def test_short_text_single_chunk(self):
-        """Short text should return a single chunk."""
-        text = "Hello, world!"
-        result = chunk_text(text)
-        assert result == ["Hello, world!"]
-
-    def test_exact_chunk_size(self):
-        """Text exactly at chunk size should return one chunk."""
-        text = "a" * CHUNK_TEXT_SIZE
-        result = chunk_text(text)
-        assert len(result) == 1
-        assert result[0] == text
-
-    def test_text_splits_into_multiple_chunks(self):
-        """Text longer than chunk size should split into multiple chunks."""
-        text = "a" * (CHUNK_TEXT_SIZE * 2 + 100)
-        result = chunk_text(text)
-        assert len(result) == 3
-        assert len(result[0]) == CHUNK_TEXT_SIZE
-        assert len(result[1]) == CHUNK_TEXT_SIZE
-        assert len(result[2]) == 100
-
-    def test_custom_chunk_size(self):
-        """Custom chunk size should be respected."""
-        text = "Hello, world! This is a test."
-        result = chunk_text(text, chunk_size=10)
-        assert len(result) == 3
-        assert result[0] == "Hello, wor"
-        assert result[1] == "ld! This i"
-        assert result[2] == "s a test."
-
-    def test_empty_string(self):
-        """Empty string should return empty list."""
-        result = chunk_text("")
-        assert result == []
+    @pytest.mark.parametrize(
+        ("text", "kwargs", "expected"),
+        [
+            pytest.param("Hello, world!", {}, ["Hello, world!"], id="short-single-chunk"),
+            pytest.param("a" * CHUNK_TEXT_SIZE, {}, ["a" * CHUNK_TEXT_SIZE], id="exact-chunk-size"),
+            pytest.param(
+                THREE_CHUNK_TEXT,
+                {},
+                ["a" * CHUNK_TEXT_SIZE, "a" * CHUNK_TEXT_SIZE, "a" * 100],
+                id="splits-into-multiple-chunks",
+            ),
+            pytest.param(
+                "Hello, world! This is a test.",
+                {"chunk_size": 10},
+                ["Hello, wor", "ld! This i", "s a test."],
+                id="custom-chunk-size",
+            ),
+            pytest.param("", {}, [], id="empty-string"),
+        ],
+    )
+    def test_chunk_text(self, text, kwargs, expected):
+        assert chunk_text(text, **kwargs) == expected
+
+    def test_newlines_and_multibyte_characters_preserved(self):
+        """Chunks should split on character count regardless of line breaks."""
+        text = "é😀\n" * 5
+        result = chunk_text(text, chunk_size=4)
+        assert "".join(result) == text
+        assert result == [text[i : i + 4] for i in range(0, len(text), 4)]
 
 
 class TestTruncateText:
     """Tests for the truncate_text function."""
 
-    def test_short_text_unchanged(self):
-        """Text shorter than max_length should be unchanged."""
-        text = "Hello"
-        result = truncate_text(text, 10)
-        assert result == "Hello"
-
-    def test_exact_length_unchanged(self):
-        """Text at exact max_length should be unchanged."""
-        text = "Hello"
-        result = truncate_text(text, 5)
-        assert result == "Hello"
-
-    def test_long_text_truncated(self):
-        """Text longer than max_length should be truncated with suffix."""
-        text = "Hello, world!"
-        result = truncate_text(text, 8)
-        assert result == "Hello, w..."
-
-    def test_custom_suffix(self):
-        """Custom suffix should be used."""
-        text = "Hello, world!"
-        result = truncate_text(text, 8, suffix="[cut]")
-        assert result == "Hello, w[cut]"
-
-    def test_none_returns_none(self):
-        """None input should return None."""
-        result = truncate_text(None, 10)
-        assert result is None
+    @pytest.mark.parametrize(
+        ("text", "max_length", "kwargs", "expected"),
+        [
+            pytest.param("Hello", 10, {}, "Hello", id="short-text-unchanged"),
+            pytest.param("Hello", 5, {}, "Hello", id="exact-length-unchanged"),
+            pytest.param("Hello, world!", 8, {}, "Hello, w...", id="long-text-truncated"),
+            pytest.param(
+                "Hello, world!", 8, {"suffix": "[cut]"}, "Hello, w[cut]", id="custom-suffix"
+            ),
+            pytest.param("Hello, world!", 8, {"suffix": ""}, "Hello, w", id="empty-suffix"),
+            pytest.param(None, 10, {}, None, id="none-returns-none"),
+        ],
+    )
+    def test_truncate_text(self, text, max_length, kwargs, expected):
+        assert truncate_text(text, max_length, **kwargs) == expected
 
 
 class TestFormatXAIError:
@@ -109,7 +92,14 @@ class TestFormatXAIError:
         """Basic exception should format correctly."""
         error = Exception("Something went wrong")
         result = format_xai_error(error)
-        assert "Something went wrong" in result
+        assert result == "Something went wrong"
+
+    def test_subclass_with_status_lists_both_details(self):
+        """Status and error type should each get their own detail line."""
+        error = ValueError("Bad input")
+        error.status_code = 400
+        result = format_xai_error(error)
+        assert result == "Bad input\n\nStatus: 400\nError: ValueError"
 
     def test_exception_with_status_code(self):
         """Exception with status_code attribute should include it."""
@@ -230,6 +220,17 @@ class TestChatCompletionParameters:
         assert params_two.tools == []
         assert params_one.tools is not params_two.tools
 
+    def test_conversation_state_is_slotted(self):
+        """Per-conversation dataclasses should not carry an instance __dict__."""
+        mcp_server = McpServerConfig(server_url="https://mcp.example.com", server_label="mcp")
+        params = ChatCompletionParameters(model="grok-4.3", mcp_servers=[mcp_server])
+        conversation = Conversation(params=params)
+
+        for instance in (mcp_server, params, conversation):
+            assert not hasattr(instance, "__dict__")
+            with pytest.raises(AttributeError):
+                instance.unexpected_attribute = True
+
     def test_default_mcp_servers_isolated(self):
         params_one = ChatCompletionParameters(model="grok-4.3")
         params_one.mcp_servers.append(